@@ -56,6 +56,9 @@ class ClipboardHistoryApp:
         self.qt_app = None
         self.signal_bridge = None
 
+        # Content hashes already on GitHub (None until the first snapshot push)
+        self._pushed_hashes = None
+
         # Threading
         self._shutdown_event = threading.Event()
 
@@ -176,6 +179,12 @@ class ClipboardHistoryApp:
             # Add to history
             added = self.clipboard_history.add_entry(content, timestamp)
 
+            # add_entry() returns (is_new, evicted_entry); trimming the oldest
+            # entry isn't a deletion, so it mustn't force a sync snapshot
+            evicted = added[1]
+            if evicted and self._pushed_hashes is not None:
+                self._pushed_hashes.discard(evicted.content_hash)
+
             if added:
                 # Save to database
                 entries = self.clipboard_history.get_entries(limit=1)
@@ -204,21 +213,44 @@ class ClipboardHistoryApp:
             return
 
         try:
-            # Export current history
+            entries = self.clipboard_history.get_entries()
+            local_hashes = {e.content_hash for e in entries}
+
+            # Deltas only add entries - a local clear or deletion since the
+            # last push needs a full snapshot to reach other devices
+            snapshot = (self._pushed_hashes is None
+                        or not self._pushed_hashes <= local_hashes
+                        or self.github_sync.needs_snapshot())
+            if snapshot:
+                # Full snapshot (also prunes the deltas it supersedes)
+                pushed = entries
+            else:
+                # Delta: only entries added since the last push
+                pushed = [e for e in entries if e.content_hash not in self._pushed_hashes]
+                if not pushed:
+                    logger.debug("Push sync skipped - no new entries")
+                    return
+
             history_data = {
-                'entries': [e.to_dict() for e in self.clipboard_history.get_entries()],
+                'entries': [e.to_dict() for e in pushed],
                 'timestamp': datetime.now().isoformat(),
                 'device': os.environ.get('COMPUTERNAME', 'unknown')
             }
 
-            # Encrypt before upload
-            encrypted = self.encryption_manager.encrypt_json(history_data)
+            # Encrypt before upload (compressed only when opted in)
+            encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
             # Push to GitHub using real-time sync endpoint
-            success = self.github_sync.push_latest(encrypted)
+            if snapshot:
+                success = self.github_sync.push_latest(encrypted)
+            else:
+                success = self.github_sync.push_delta(encrypted)
 
             if success:
-                logger.debug("Push sync completed")
+                if snapshot:
+                    self._pushed_hashes = set()
+                self._pushed_hashes.update(e.content_hash for e in pushed)
+                logger.debug(f"Push sync completed ({len(pushed)} entries)")
             else:
                 logger.warning("Push sync failed")
 
@@ -231,23 +263,35 @@ class ClipboardHistoryApp:
             return
 
         try:
+            # One conditional request tells whether anything changed remotely
+            if not self.github_sync.check_for_updates():
+                return
+
             # Get local hashes for comparison
             local_hashes = {e.content_hash for e in self.clipboard_history.get_entries()}
 
-            # Get new entries from GitHub
+            # Get the snapshot (if changed) plus deltas pushed since
+            payloads = []
             encrypted_data = self.github_sync.pull_latest()
+            if encrypted_data:
+                payloads.append(encrypted_data)
+            payloads.extend(self.github_sync.pull_deltas())
 
-            if not encrypted_data:
+            if not payloads:
                 return  # No updates or error
 
             # Decrypt data
-            decrypted = self.encryption_manager.decrypt_json(encrypted_data)
-
-            if not decrypted:
-                return
+            remote_entries = []
+            for payload in payloads:
+                try:
+                    decrypted = self.encryption_manager.decrypt_json(payload)
+                except Exception as e:
+                    logger.error(f"Failed to decrypt sync data: {e}")
+                    continue
+                if decrypted:
+                    remote_entries.extend(decrypted.get('entries', []))
 
             # Process new entries
-            remote_entries = decrypted.get('entries', [])
             new_count = 0
 
             for entry_data in remote_entries:
@@ -277,6 +321,14 @@ class ClipboardHistoryApp:
                 except Exception as e:
                     logger.error(f"Failed to import entry: {e}")
 
+            # Remote entries are on GitHub already - never push them as deltas.
+            # Only those held locally count, or they'd look like local deletions.
+            if self._pushed_hashes is not None:
+                self._pushed_hashes.update(
+                    e['content_hash'] for e in remote_entries
+                    if e.get('content_hash') in local_hashes
+                )
+
             if new_count > 0:
                 logger.info(f"Pulled {new_count} new entries from GitHub")
 
@@ -319,6 +371,10 @@ class ClipboardHistoryApp:
             if self.tray_icon:
                 self.tray_icon.update_tooltip("ClipboardHistory (Active)")
 
+    def _compress_uploads(self) -> bool:
+        """Whether sync payloads are uploaded compressed (opt-in: older clients can't read them)"""
+        return bool(self.config_manager and self.config_manager.get('github.compress_payloads', False))
+
     def _sync_to_github(self):
         """Manually sync to GitHub (runs in main thread)"""
         # Run in separate thread to avoid blocking UI
@@ -332,7 +388,7 @@ class ClipboardHistoryApp:
                     }
 
                     # Encrypt before upload
-                    encrypted = self.encryption_manager.encrypt_json(history_data)
+                    encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
                     # Upload to GitHub
                     success = self.github_sync.upload_backup(encrypted)
@@ -468,6 +524,8 @@ class ClipboardHistoryApp:
             # Stop auto sync service
             if self.auto_sync_service:
                 self.auto_sync_service.stop()
+                # Upload changes still waiting for the debounce timer
+                self.auto_sync_service.flush()
 
             # Stop tray icon
             if self.tray_icon:
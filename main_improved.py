@@ -2,9 +2,9 @@
 
 import sys
 import os
+import time
 import signal
 import threading
-import yaml
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer, pyqtSignal, QObject
@@ -24,7 +24,7 @@ from src.services.auto_sync_service import AutoSyncService
 from src.services.archive_manager import ArchiveManager
 from src.ui.tray import TrayIcon
 from src.ui.history import HistoryViewer
-from src.utils import ConfigManager
+from src.utils import ConfigManager, yaml_codec
 
 
 class QtSignalBridge(QObject):
@@ -80,7 +80,7 @@ class ClipboardHistoryApp:
 
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
-                    settings = yaml.safe_load(f) or {}
+                    settings = yaml_codec.load(f) or {}
                     github_settings = settings.get('github', {})
 
                     # Load token from keyring (secure storage)
@@ -362,40 +362,45 @@ class ClipboardHistoryApp:
                 self.tray_icon.update_icon(active=True)  # Update icon to active state
                 # tooltip update is now handled in update_icon
 
+    def _compress_uploads(self) -> bool:
+        """Whether sync payloads are uploaded compressed (opt-in: older clients can't read them)"""
+        return bool(self.config_manager and self.config_manager.get('github.compress_payloads', False))
+
     def _sync_to_github(self):
         """Manually sync to GitHub (runs in main thread)"""
-        # Run in separate thread to avoid blocking UI
+        if not self.github_sync or not self.github_sync.enabled:
+            logger.warning("GitHub sync not configured")
+            return
+
+        # Run on the sync service's background threads to avoid blocking UI
         def sync_task():
-            if self.github_sync and self.github_sync.enabled:
-                try:
-                    # Export current history
-                    history_data = {
-                        'entries': [e.to_dict() for e in self.clipboard_history.get_entries()],
-                        'settings': self.config_manager.get_all()
-                    }
+            try:
+                # Export current history
+                history_data = {
+                    'entries': [e.to_dict() for e in self.clipboard_history.get_entries()],
+                    'settings': self.config_manager.get_all()
+                }
 
-                    # Encrypt before upload
-                    encrypted = self.encryption_manager.encrypt_json(history_data)
+                # Encrypt before upload
+                encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
-                    # Upload to GitHub
-                    success = self.github_sync.upload_backup(encrypted)
+                # Upload to GitHub
+                success = self.github_sync.upload_backup(encrypted)
 
-                    if success:
-                        logger.info("Successfully synced to GitHub")
-                        if self.signal_bridge:
-                            self.signal_bridge.show_notification_signal.emit(
-                                "GitHub Sync",
-                                "Backup uploaded successfully"
-                            )
-                    else:
-                        logger.error("GitHub sync failed")
+                if success:
+                    logger.info("Successfully synced to GitHub")
+                    if self.signal_bridge:
+                        self.signal_bridge.show_notification_signal.emit(
+                            "GitHub Sync",
+                            "Backup uploaded successfully"
+                        )
+                else:
+                    logger.error("GitHub sync failed")
 
-                except Exception as e:
-                    logger.error(f"GitHub sync error: {e}")
-            else:
-                logger.warning("GitHub sync not configured")
+            except Exception as e:
+                logger.error(f"GitHub sync error: {e}")
 
-        threading.Thread(target=sync_task, daemon=True).start()
+        self.github_sync.submit(sync_task)
 
     def _auto_sync_to_github(self):
         """Auto sync callback - runs in background thread"""
@@ -408,11 +413,10 @@ class ClipboardHistoryApp:
                 }
 
                 # Encrypt before upload
-                encrypted = self.encryption_manager.encrypt_json(history_data)
+                encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
                 # Upload to GitHub with auto-generated filename
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
                 filename = f"auto_backup_{timestamp}.json"
                 success = self.github_sync.upload_backup(encrypted, filename)
 
@@ -435,11 +439,6 @@ class ClipboardHistoryApp:
             return
 
         try:
-            # Clear local cache first (GitHub is always primary)
-            logger.info("Clearing local cache before initial GitHub sync...")
-            self.repository.clear_all()
-            self.clipboard_history.clear()
-
             # Download single sync file
             logger.info("Loading initial data from GitHub...")
             backup_data = self.github_sync.download_backup()
@@ -452,6 +451,12 @@ class ClipboardHistoryApp:
                 logger.warning("Failed to decrypt GitHub backup - may need sync password")
                 return
 
+            # Clear local cache (GitHub is always primary) - only once the remote
+            # data is known to be readable, so a bad download can't wipe history
+            logger.info("Clearing local cache before initial GitHub sync...")
+            self.repository.clear_all()
+            self.clipboard_history.clear()
+
             # Load all entries from GitHub
             remote_entries = decrypted.get('entries', [])
             loaded_count = 0
@@ -493,7 +498,7 @@ class ClipboardHistoryApp:
             }
 
             # Encrypt before upload
-            encrypted = self.encryption_manager.encrypt_json(history_data)
+            encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
             # Upload to GitHub (always uses single file)
             success = self.github_sync.upload_backup(encrypted)
@@ -587,7 +592,7 @@ class ClipboardHistoryApp:
             }
 
             # Encrypt before upload
-            encrypted = self.encryption_manager.encrypt_json(history_data)
+            encrypted = self.encryption_manager.encrypt_json(history_data, compress=self._compress_uploads())
 
             # Upload to GitHub
             success = self.github_sync.upload_backup(encrypted)
@@ -755,11 +760,17 @@ class ClipboardHistoryApp:
             # Stop auto sync
             if hasattr(self, 'auto_sync') and self.auto_sync:
                 self.auto_sync.stop()
+                # Upload changes still waiting for the debounce timer
+                self.auto_sync.flush()
 
             # Stop tray icon
             if self.tray_icon:
                 self.tray_icon.stop()
 
+            # Stop GitHub sync threads and connections
+            if self.github_sync:
+                self.github_sync.close()
+
             # Close database
             if self.database_manager:
                 self.database_manager.close()
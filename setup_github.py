@@ -2,10 +2,11 @@
 
 import os
 import sys
-import yaml
 from pathlib import Path
 from getpass import getpass
 
+from src.utils import yaml_codec
+
 def setup_github_sync():
     """Interactive setup for GitHub sync"""
 
@@ -47,13 +48,13 @@ def setup_github_sync():
 
     if settings_path.exists():
         with open(settings_path, 'r') as f:
-            settings = yaml.safe_load(f) or {}
+            settings = yaml_codec.load(f) or {}
     else:
         # Load default settings
         default_path = Path(__file__).parent / 'config' / 'default_settings.yaml'
         if default_path.exists():
             with open(default_path, 'r') as f:
-                settings = yaml.safe_load(f) or {}
+                settings = yaml_codec.load(f) or {}
         else:
             settings = {}
 
@@ -69,7 +70,7 @@ def setup_github_sync():
 
     # Save settings
     with open(settings_path, 'w') as f:
-        yaml.dump(settings, f, default_flow_style=False)
+        yaml_codec.dump(settings, f)
 
     print("\n" + "=" * 60)
     print("✅ GitHub Sync Configuration Saved!")
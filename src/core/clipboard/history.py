@@ -1,15 +1,21 @@
 """Clipboard history management with duplicate detection"""
 
 import hashlib
+import sys
 import threading
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, TextIO
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import json
 from loguru import logger
 
 
-@dataclass
+# Entries use __slots__ where dataclasses support it (Python 3.10+): smaller
+# objects and faster attribute access when loading or restoring large histories
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ClipboardEntry:
     """Single clipboard history entry"""
     content: str
@@ -121,20 +127,21 @@ class ClipboardHistory:
             logger.info(f"Added new entry: category={category}, hash={entry.content_hash[:8]}")
             return True, removed_entry
 
-    def get_entries(self, limit: Optional[int] = None) -> List[ClipboardEntry]:
+    def get_entries(self, limit: Optional[int] = None, offset: int = 0) -> List[ClipboardEntry]:
         """
         Get history entries
 
         Args:
             limit: Optional limit on number of entries
+            offset: Number of newest entries to skip
 
         Returns:
             List of clipboard entries (newest first)
         """
         with self._lock:
             if limit:
-                return self._entries[:limit]
-            return self._entries.copy()
+                return self._entries[offset:offset + limit]
+            return self._entries[offset:]
 
     def search(self, query: str, case_sensitive: bool = False) -> List[ClipboardEntry]:
         """
@@ -301,18 +308,44 @@ class ClipboardHistory:
 
     def to_json(self) -> str:
         """Export history to JSON"""
+        return json.dumps(self._export_data(), indent=2)
+
+    def to_json_file(self, fp: TextIO) -> None:
+        """
+        Export history as JSON to an open text file
+
+        Encoded output is written as it is produced instead of first being
+        built up as one string.
+
+        Args:
+            fp: File opened for writing
+        """
+        json.dump(self._export_data(), fp, indent=2)
+
+    def _export_data(self) -> Dict[str, Any]:
+        """Snapshot the history as a JSON-serializable dict"""
         with self._lock:
-            data = {
+            return {
                 'entries': [e.to_dict() for e in self._entries],
                 'max_size': self.max_size,
                 'dedupe_enabled': self.dedupe_enabled
             }
-        return json.dumps(data, indent=2)
 
     def from_json(self, json_str: str) -> None:
         """Import history from JSON"""
-        data = json.loads(json_str)
+        self._import_data(json.loads(json_str))
+
+    def from_json_file(self, fp: TextIO) -> None:
+        """
+        Import history from an open JSON text file
+
+        Args:
+            fp: File opened for reading
+        """
+        self._import_data(json.load(fp))
 
+    def _import_data(self, data: Dict[str, Any]) -> None:
+        """Replace the history with parsed export data"""
         with self._lock:
             self.max_size = data.get('max_size', 1000)
             self.dedupe_enabled = data.get('dedupe_enabled', True)
@@ -1,6 +1,7 @@
 """Encryption manager for secure data handling using AES-256-GCM"""
 
 import os
+import zlib
 import base64
 import json
 from typing import Any, Dict, Optional
@@ -8,6 +9,12 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from loguru import logger
 
+from ...utils import json_codec
+
+
+# zlib level for compressed JSON payloads (6 is zlib's speed/ratio default)
+COMPRESSION_LEVEL = 6
+
 
 class EncryptionManager:
     """Handles encryption and decryption of clipboard data"""
@@ -46,31 +53,7 @@ class EncryptionManager:
             Dictionary with encrypted data, nonce, and tag
         """
         try:
-            # Generate a random 96-bit nonce
-            nonce = os.urandom(12)
-
-            # Create cipher
-            cipher = Cipher(
-                algorithms.AES(self.key),
-                modes.GCM(nonce),
-                backend=self.backend
-            )
-            encryptor = cipher.encryptor()
-
-            # Encrypt data
-            plaintext = data.encode('utf-8')
-            ciphertext = encryptor.update(plaintext) + encryptor.finalize()
-
-            # Get authentication tag
-            tag = encryptor.tag
-
-            # Encode to base64 for storage
-            result = {
-                'ciphertext': base64.b64encode(ciphertext).decode('ascii'),
-                'nonce': base64.b64encode(nonce).decode('ascii'),
-                'tag': base64.b64encode(tag).decode('ascii')
-            }
-
+            result = self._encrypt_bytes(data.encode('utf-8'))
             logger.debug(f"Encrypted {len(data)} characters")
             return result
 
@@ -78,6 +61,40 @@ class EncryptionManager:
             logger.error(f"Encryption failed: {e}")
             raise
 
+    def _encrypt_bytes(self, plaintext: bytes) -> Dict[str, str]:
+        """
+        Encrypt raw bytes using AES-256-GCM
+
+        Args:
+            plaintext: Bytes to encrypt
+
+        Returns:
+            Dictionary with base64 encoded ciphertext, nonce, and tag
+        """
+        # Generate a random 96-bit nonce
+        nonce = os.urandom(12)
+
+        # Create cipher
+        cipher = Cipher(
+            algorithms.AES(self.key),
+            modes.GCM(nonce),
+            backend=self.backend
+        )
+        encryptor = cipher.encryptor()
+
+        # Encrypt data
+        ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+
+        # Get authentication tag
+        tag = encryptor.tag
+
+        # Encode to base64 for storage
+        return {
+            'ciphertext': base64.b64encode(ciphertext).decode('ascii'),
+            'nonce': base64.b64encode(nonce).decode('ascii'),
+            'tag': base64.b64encode(tag).decode('ascii')
+        }
+
     def decrypt(self, encrypted_data: Dict[str, str]) -> str:
         """
         Decrypt data encrypted with AES-256-GCM
@@ -89,23 +106,7 @@ class EncryptionManager:
             Decrypted string
         """
         try:
-            # Decode from base64
-            ciphertext = base64.b64decode(encrypted_data['ciphertext'])
-            nonce = base64.b64decode(encrypted_data['nonce'])
-            tag = base64.b64decode(encrypted_data['tag'])
-
-            # Create cipher
-            cipher = Cipher(
-                algorithms.AES(self.key),
-                modes.GCM(nonce, tag),
-                backend=self.backend
-            )
-            decryptor = cipher.decryptor()
-
-            # Decrypt data
-            plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-
-            result = plaintext.decode('utf-8')
+            result = self._decrypt_bytes(encrypted_data).decode('utf-8')
             logger.debug(f"Decrypted {len(result)} characters")
             return result
 
@@ -113,18 +114,58 @@ class EncryptionManager:
             logger.error(f"Decryption failed: {e}")
             raise
 
-    def encrypt_json(self, obj: Any) -> Dict[str, str]:
+    def _decrypt_bytes(self, encrypted_data: Dict[str, str]) -> bytes:
+        """
+        Decrypt AES-256-GCM data to raw bytes
+
+        Args:
+            encrypted_data: Dictionary with ciphertext, nonce, and tag
+
+        Returns:
+            Decrypted bytes
+        """
+        # Decode from base64
+        ciphertext = base64.b64decode(encrypted_data['ciphertext'])
+        nonce = base64.b64decode(encrypted_data['nonce'])
+        tag = base64.b64decode(encrypted_data['tag'])
+
+        # Create cipher
+        cipher = Cipher(
+            algorithms.AES(self.key),
+            modes.GCM(nonce, tag),
+            backend=self.backend
+        )
+        decryptor = cipher.decryptor()
+
+        # Decrypt data
+        return decryptor.update(ciphertext) + decryptor.finalize()
+
+    def encrypt_json(self, obj: Any, compress: bool = False) -> Dict[str, str]:
         """
         Encrypt a JSON-serializable object
 
         Args:
             obj: Object to encrypt
+            compress: Compress the JSON before encryption (ciphertext itself
+                can't be compressed, so this is the only point where it helps).
+                Only decrypt_json() from this version on can read the result,
+                so callers must keep it off until every syncing device can.
 
         Returns:
             Encrypted data dictionary
         """
-        json_str = json.dumps(obj, ensure_ascii=False, indent=2)
-        return self.encrypt(json_str)
+        json_bytes = json_codec.dumps(obj)
+        if not compress:
+            result = self._encrypt_bytes(json_bytes)
+            logger.debug(f"Encrypted {len(json_bytes)} bytes of JSON")
+            return result
+
+        compressed = zlib.compress(json_bytes, COMPRESSION_LEVEL)
+
+        result = self._encrypt_bytes(compressed)
+        result['compression'] = 'zlib'
+        logger.debug(f"Encrypted {len(json_bytes)} bytes of JSON (compressed to {len(compressed)})")
+        return result
 
     def decrypt_json(self, encrypted_data: Dict[str, str]) -> Any:
         """
@@ -136,8 +177,15 @@ class EncryptionManager:
         Returns:
             Decrypted and parsed object
         """
-        json_str = self.decrypt(encrypted_data)
-        return json.loads(json_str)
+        try:
+            plaintext = self._decrypt_bytes(encrypted_data)
+            if encrypted_data.get('compression') == 'zlib':
+                plaintext = zlib.decompress(plaintext)
+        except Exception as e:
+            logger.error(f"Decryption failed: {e}")
+            raise
+
+        return json_codec.loads(plaintext)
 
     def encrypt_file(self, input_path: str, output_path: str) -> None:
         """
@@ -3,13 +3,33 @@
 import os
 from pathlib import Path
 from typing import Optional
-from sqlalchemy import create_engine, Column, String, DateTime, Text, Boolean, Integer
+from sqlalchemy import create_engine, event, text, Column, String, DateTime, Text, Boolean, Integer
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from loguru import logger
 
 Base = declarative_base()
 
+# Applied to every new SQLite connection. WAL turns each commit into an append
+# to the -wal file, and with WAL synchronous=NORMAL only fsyncs at checkpoints
+# while still surviving application crashes - so bulk writes like a restore
+# (and every clipboard save) stop paying an fsync per transaction.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a freshly opened SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 class ClipboardEntryDB(Base):
     """Database model for clipboard entries"""
@@ -65,6 +85,7 @@ class DatabaseManager:
                 f'sqlite:///{self.db_path}',
                 connect_args={'check_same_thread': False}
             )
+            event.listen(self.engine, 'connect', _apply_sqlite_pragmas)
 
             # Create tables if they don't exist
             Base.metadata.create_all(bind=self.engine)
@@ -105,6 +126,10 @@ class DatabaseManager:
         """
         try:
             import shutil
+
+            # Fold the WAL into the main file first so the copy is complete
+            with self.engine.connect() as conn:
+                conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
             shutil.copy2(self.db_path, backup_path)
             logger.info(f"Database backed up to: {backup_path}")
 
@@ -115,7 +140,6 @@ class DatabaseManager:
     def vacuum(self):
         """Optimize database (VACUUM operation)"""
         try:
-            from sqlalchemy import text
             with self.engine.connect() as conn:
                 conn.execute(text("VACUUM"))
                 conn.commit()
@@ -1,7 +1,7 @@
 """Improved repository pattern with better session management"""
 
 import json
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 from loguru import logger
@@ -11,6 +11,13 @@ from ..clipboard.history import ClipboardEntry
 from ..encryption.manager import EncryptionManager
 
 
+# Indexes replace_all() drops and rebuilds once instead of updating per row.
+# Unique indexes stay: content_hash uniqueness must hold during the insert.
+_DEFERRED_INDEXES = tuple(
+    index for index in ClipboardEntryDB.__table__.indexes if not index.unique
+)
+
+
 class ClipboardRepository:
     """Repository for clipboard data operations with improved session management"""
 
@@ -84,12 +91,76 @@ class ClipboardRepository:
             logger.error(f"Failed to save entry: {e}")
             return False
 
-    def get_entries(self, limit: Optional[int] = None) -> List[ClipboardEntry]:
+    def replace_all(self, batches: Iterable[List[ClipboardEntry]]) -> int:
+        """
+        Replace all clipboard entries in a single transaction
+
+        The table is emptied and refilled inside one transaction, so an error
+        part way leaves the previous history untouched. Batches are consumed
+        lazily, letting the caller build entries as they are written.
+        Secondary indexes are rebuilt once at the end rather than per row.
+
+        Args:
+            batches: Lists of entries to insert (content hashes must be unique)
+
+        Returns:
+            Number of entries written, or -1 on failure (nothing changed)
+        """
+        try:
+            count = 0
+            with self.get_session() as session:
+                # Unfiltered DELETE: SQLite empties the table without visiting rows
+                session.query(ClipboardEntryDB).delete()
+
+                # DDL is transactional in SQLite, so a rollback restores these too
+                connection = session.connection()
+                for index in _DEFERRED_INDEXES:
+                    index.drop(bind=connection, checkfirst=True)
+
+                for batch in batches:
+                    session.bulk_insert_mappings(ClipboardEntryDB, [self._to_row(entry) for entry in batch])
+                    count += len(batch)
+
+                # Built in one sorted pass instead of maintained row by row
+                for index in _DEFERRED_INDEXES:
+                    index.create(bind=connection)
+
+            logger.info(f"Replaced clipboard history with {count} entries")
+            return count
+
+        except Exception as e:
+            logger.error(f"Failed to replace clipboard entries: {e}")
+            return -1
+
+    def _to_row(self, entry: ClipboardEntry) -> Dict[str, Any]:
+        """
+        Encrypt an entry into a clipboard_entries row for bulk inserts
+
+        Args:
+            entry: Clipboard entry
+
+        Returns:
+            Column values for ClipboardEntryDB
+        """
+        encrypted_data = self.encryption.encrypt(entry.content)
+        return {
+            'content_hash': entry.content_hash,
+            'encrypted_content': encrypted_data['ciphertext'],
+            'encrypted_nonce': encrypted_data['nonce'],
+            'encrypted_tag': encrypted_data['tag'],
+            'timestamp': entry.timestamp,
+            # category is NOT NULL; one bad row would fail the whole batch
+            'category': entry.category or 'text',
+            'entry_metadata': json.dumps(entry.metadata) if entry.metadata else None
+        }
+
+    def get_entries(self, limit: Optional[int] = None, offset: int = 0) -> List[ClipboardEntry]:
         """
         Get clipboard entries from database
 
         Args:
             limit: Optional limit on number of entries
+            offset: Number of newest entries to skip
 
         Returns:
             List of clipboard entries
@@ -100,6 +171,8 @@ class ClipboardRepository:
                     ClipboardEntryDB.timestamp.desc()
                 )
 
+                if offset:
+                    query = query.offset(offset)
                 if limit:
                     query = query.limit(limit)
 
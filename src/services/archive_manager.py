@@ -2,11 +2,15 @@
 
 import json
 import os
+import time
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from loguru import logger
 
+from ..utils import json_codec
+
 
 class ArchiveManager:
     """Manages archived clipboard entries when main history exceeds limit"""
@@ -24,6 +28,11 @@ class ArchiveManager:
         self.github_sync = github_sync_service
         self.archive_dir = self._get_archive_directory()
 
+        # Last filename timestamp and per-second counter, so archives written
+        # within the same second don't overwrite each other
+        self._last_stamp: Optional[str] = None
+        self._stamp_seq = 0
+
         # Create archive directory if it doesn't exist
         os.makedirs(self.archive_dir, exist_ok=True)
 
@@ -54,15 +63,15 @@ class ArchiveManager:
 
         try:
             # Generate archive filename with current date
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            archive_filename = f"archive_{timestamp}.json"
+            archive_filename = f"archive_{self._next_timestamp()}.json"
 
             # Prepare archive data
+            now = datetime.now()
             archive_data = {
-                'archived_at': datetime.now().isoformat(),
+                'archived_at': now.isoformat(),
                 'entry_count': len(entries),
                 'entries': entries,
-                'expires_at': (datetime.now() + timedelta(days=self.ARCHIVE_RETENTION_DAYS)).isoformat()
+                'expires_at': (now + timedelta(days=self.ARCHIVE_RETENTION_DAYS)).isoformat()
             }
 
             # Save to local archive
@@ -82,6 +91,23 @@ class ArchiveManager:
             logger.error(f"Failed to archive entries: {e}")
             return False
 
+    def _next_timestamp(self) -> str:
+        """
+        Get a unique filename timestamp (YYYYMMDD_HHMMSS, plus a counter
+        suffix when several archives are written within the same second)
+
+        Returns:
+            Timestamp string
+        """
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.localtime())
+        if stamp != self._last_stamp:
+            self._last_stamp = stamp
+            self._stamp_seq = 0
+            return stamp
+
+        self._stamp_seq += 1
+        return f"{stamp}_{self._stamp_seq}"
+
     def _upload_archive_to_github(self, filename: str, data: Dict[str, Any]) -> bool:
         """
         Upload archive to GitHub
@@ -95,7 +121,7 @@ class ArchiveManager:
         """
         try:
             filepath = f"archives/{filename}"
-            content = json.dumps(data, indent=2)
+            content = json_codec.dumps(data)
 
             # Check if file exists (shouldn't normally)
             try:
@@ -316,9 +342,10 @@ class ArchiveManager:
                         pass
 
             if archives:
-                archives.sort(key=lambda x: x[0])
-                stats['oldest_archive'] = archives[0][1]
-                stats['newest_archive'] = archives[-1][1]
+                # Only the ends are needed - two linear scans instead of a sort
+                by_time = itemgetter(0)
+                stats['oldest_archive'] = min(archives, key=by_time)[1]
+                stats['newest_archive'] = max(archives, key=by_time)[1]
 
         except Exception as e:
             logger.error(f"Error getting archive stats: {e}")
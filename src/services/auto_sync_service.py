@@ -38,6 +38,10 @@ class AutoSyncService:
         self._pending_changes = 0
         self._lock = threading.RLock()
 
+        # Serializes push callbacks; separate from _lock so trigger_push()
+        # (called on clipboard changes) never waits on network I/O
+        self._push_lock = threading.Lock()
+
     def set_push_callback(self, callback: Callable):
         """Set the callback function for pushing (upload to GitHub)"""
         self._push_callback = callback
@@ -93,15 +97,33 @@ class AutoSyncService:
                 self._debounce_timer.start()
                 return
 
-            # Execute push
+            # Claim the pending changes; changes arriving during the push
+            # schedule the next one
+            pending = self._pending_changes
+            self._pending_changes = 0
+
+        self._run_push(pending, "push sync")
+
+    def _run_push(self, pending: int, label: str):
+        """
+        Run the push callback outside the state lock
+
+        Args:
+            pending: Number of changes this push covers
+            label: Description for log messages
+        """
+        with self._push_lock:
             try:
-                logger.info(f"Executing push sync ({self._pending_changes} changes)")
+                logger.info(f"Executing {label} ({pending} changes)")
                 self._push_callback()
-                self._last_push = datetime.now()
-                self._pending_changes = 0
-                logger.info("Push sync completed")
+                with self._lock:
+                    self._last_push = datetime.now()
+                logger.info(f"{label.capitalize()} completed")
             except Exception as e:
-                logger.error(f"Push sync failed: {e}")
+                logger.error(f"{label.capitalize()} failed: {e}")
+                with self._lock:
+                    # Not uploaded - keep them pending for the next push
+                    self._pending_changes += pending
 
     def _execute_pull(self):
         """Execute pull sync and schedule next one"""
@@ -174,13 +196,25 @@ class AutoSyncService:
                 logger.warning("No push callback set")
                 return
 
-            try:
-                logger.info("Executing forced push sync")
-                self._push_callback()
-                self._last_push = datetime.now()
-                self._pending_changes = 0
-            except Exception as e:
-                logger.error(f"Forced push sync failed: {e}")
+            pending = self._pending_changes
+            self._pending_changes = 0
+
+        self._run_push(pending, "forced push sync")
+
+    def flush(self):
+        """Push pending changes right away (e.g. before shutdown), if there are any"""
+        with self._lock:
+            if self._pending_changes == 0 or not self._push_callback:
+                return
+
+            if self._debounce_timer:
+                self._debounce_timer.cancel()
+                self._debounce_timer = None
+
+            pending = self._pending_changes
+            self._pending_changes = 0
+
+        self._run_push(pending, "final push sync")
 
     def force_pull(self):
         """Force an immediate pull sync"""
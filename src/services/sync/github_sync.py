@@ -1,17 +1,174 @@
 """GitHub synchronization service for encrypted clipboard backup"""
 
+import os
 import json
+import time
 import base64
-import requests
-from typing import Optional, Dict, Any, List, Set, Tuple
-from datetime import datetime
-from github import Github, GithubException
+import heapq
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, Set, Tuple
 from loguru import logger
 
+from ...utils import json_codec
+
+# PyGithub and requests pull in a large import graph (urllib3, cryptography,
+# jwt...), so they're imported where used - startup stays cheap when sync is off
+if TYPE_CHECKING:
+    import requests
+
 
 # Constants for real-time sync
 LATEST_SYNC_FILE = "sync/latest.json"  # Single file for real-time sync
 
+# Per-change deltas (new entries only) pushed between full snapshots of
+# LATEST_SYNC_FILE; the next snapshot prunes them in the same commit
+DELTAS_FOLDER = "sync/deltas"
+DELTA_SNAPSHOT_THRESHOLD = 100
+
+# Timeout (seconds) for direct HTTP requests made outside PyGithub
+HTTP_TIMEOUT = 30
+
+# Connections kept alive per host, for both PyGithub and the direct session.
+# Sized for threaded callers so concurrent requests don't evict connections.
+HTTP_POOL_SIZE = 32
+
+# Transport-level retries (connection resets, e.g. a pooled keep-alive socket
+# the server already closed) for idempotent requests; HTTP statuses are
+# handled by _request's rate-limit backoff instead
+HTTP_CONNECT_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
+
+# Resolved repository + login, cached across sessions to skip connect round trips
+CONNECTION_CACHE_FILE = os.path.join(
+    os.environ.get('APPDATA', '.'),
+    'ClipboardHistory',
+    'github_connection.json'
+)
+CONNECTION_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# A successful test_connection() is trusted for this long without re-checking
+CONNECTION_CHECK_TTL = 30  # seconds
+
+# The backups listing is reused for this long without asking the server
+BACKUPS_CACHE_TTL = 60  # seconds
+
+# Largest downloaded body kept for conditional re-downloads; bigger files
+# (e.g. a full backup) are fetched in full each time instead of pinned in memory
+ETAG_BODY_CACHE_MAX = 1024 * 1024  # bytes
+
+# Parallel blob uploads when committing several files at once
+BLOB_UPLOAD_WORKERS = 8
+
+# Parallel downloads when fetching several files at once
+DOWNLOAD_WORKERS = 8
+
+# Long-lived background threads for sync calls made from the GUI
+SYNC_WORKERS = 4
+
+# Client-side pacing of direct requests: once the X-RateLimit-Remaining quota
+# drops below RATE_LIMIT_LOW_REMAINING, a token bucket spreads what's left
+# until the window resets
+RATE_LIMIT_LOW_REMAINING = 500
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MAX_RETRIES = 3
+# Longest a caller (possibly the GUI thread) is held by pacing or a throttled
+# retry; anything longer fails fast with RateLimitedError / the 403/429 response
+RATE_LIMIT_MAX_WAIT = 5  # seconds
+
+
+# Connection pool shared by the sessions of all service instances, so e.g. the
+# settings dialog's connection test reuses the app's warm TLS connections
+_shared_adapter = None
+_shared_adapter_lock = threading.Lock()
+
+
+def _get_shared_adapter():
+    """Get the process-wide HTTP adapter, creating it on first use"""
+    global _shared_adapter
+    with _shared_adapter_lock:
+        if _shared_adapter is None:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            retries = Retry(total=HTTP_CONNECT_RETRIES, backoff_factor=HTTP_RETRY_BACKOFF,
+                            status=0, raise_on_status=False)
+            _shared_adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE,
+                                          pool_maxsize=HTTP_POOL_SIZE,
+                                          max_retries=retries)
+        return _shared_adapter
+
+
+class RateLimitedError(Exception):
+    """Raised when a request would have to wait too long for GitHub's rate limit"""
+
+    def __init__(self, wait: float):
+        super().__init__(f"GitHub rate limited, retry in {wait:.0f}s")
+        self.wait = wait
+
+
+class _RateLimiter:
+    """Token bucket shared by all direct requests of one sync service"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pacing = False  # Only once the remaining quota is low
+        self._tokens = float(RATE_LIMIT_BURST)
+        self._rate = 1.0  # requests per second, set by update() before pacing starts
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0  # monotonic time when an exhausted quota resets
+
+    def acquire(self):
+        """
+        Take one token, waiting at most RATE_LIMIT_MAX_WAIT for one
+
+        Raises:
+            RateLimitedError: If no token becomes available in time
+        """
+        deadline = time.monotonic() + RATE_LIMIT_MAX_WAIT
+
+        while True:
+            with self._lock:
+                if not self._pacing:
+                    return
+
+                now = time.monotonic()
+                self._tokens = min(RATE_LIMIT_BURST, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+
+                wait = max(0.0, self._blocked_until - now)
+                if self._tokens < 1:
+                    wait = max(wait, (1 - self._tokens) / self._rate)
+                if wait == 0:
+                    self._tokens -= 1
+                    return
+
+            if now + wait > deadline:
+                raise RateLimitedError(wait)
+
+            logger.debug(f"Rate limiter: waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    def update(self, headers):
+        """
+        Refill rate from GitHub's rate limit headers
+
+        Args:
+            headers: Response headers
+        """
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_in = max(1.0, int(headers['X-RateLimit-Reset']) - time.time())
+        except (KeyError, ValueError):
+            return  # Conditional 304s and Enterprise without rate limiting
+
+        with self._lock:
+            # Spread the remaining quota evenly until the window resets
+            self._pacing = remaining < RATE_LIMIT_LOW_REMAINING
+            self._rate = max(remaining, 1) / reset_in
+            self._blocked_until = time.monotonic() + reset_in if remaining == 0 else 0.0
+
 
 class GitHubSyncService:
     """Manages GitHub synchronization for clipboard data"""
@@ -32,11 +189,51 @@ class GitHubSyncService:
         self.github = None
         self.repo = None
         self.enabled = False
+        self.api_url: Optional[str] = None
+
+        # API URL of the connected repository, used for direct requests
+        self._repo_url: Optional[str] = None
+
+        # Shared HTTP session for direct requests (keeps connections alive)
+        self._session: Optional["requests.Session"] = None
+
+        # (ETag, listing) of the backups folder for conditional requests
+        self._backups_cache: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+        # time.monotonic() when the server last confirmed _backups_cache
+        self._backups_checked_at: Optional[float] = None
+
+        # Path -> (ETag, raw body) of downloaded files for conditional requests;
+        # bodies are re-parsed on 304 so callers never share a mutable object
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+        # Path -> blob SHA of files we've written, needed to update them again
+        self._file_shas: Dict[str, str] = {}
+
+        # Background threads for *_async calls, kept warm between calls
+        self._executor = ThreadPoolExecutor(max_workers=SYNC_WORKERS,
+                                            thread_name_prefix="gh-sync")
+
+        # Paces direct requests made through _request()
+        self._limiter = _RateLimiter()
+
+        # time.monotonic() of the last successful test_connection()
+        self._last_ok_ts: Optional[float] = None
+
+        # Authenticated user loaded by connect(), reused instead of re-fetching
+        self._auth_user = None
+
+        # Branch head after our last Git Data API commit (saves two lookups per commit)
+        self._head_commit = None
 
         # Track last known state for incremental sync
         self._last_sync_sha: Optional[str] = None
         self._known_hashes: Set[str] = set()
 
+        # Delta files present at the last listing, and those already pulled/pushed
+        self._delta_paths: List[str] = []
+        self._seen_deltas: Set[str] = set()
+        self._deltas_tree_sha: Optional[str] = None  # Git tree SHA at the last listing
+
         if token and repository:
             self.connect()
 
@@ -47,6 +244,8 @@ class GitHubSyncService:
         Returns:
             True if successful
         """
+        from github import Github, GithubException
+
         try:
             if not self.token:
                 logger.warning("No GitHub token provided")
@@ -55,22 +254,41 @@ class GitHubSyncService:
             # Connect to GitHub Enterprise or regular GitHub
             if self.enterprise_url:
                 # For GitHub Enterprise, we need to append /api/v3 to the base URL
-                api_url = f"{self.enterprise_url.rstrip('/')}/api/v3"
-                logger.info(f"Connecting to GitHub Enterprise at: {api_url}")
-                self.github = Github(base_url=api_url, login_or_token=self.token)
+                self.api_url = f"{self.enterprise_url.rstrip('/')}/api/v3"
+                logger.info(f"Connecting to GitHub Enterprise at: {self.api_url}")
+                self.github = Github(base_url=self.api_url, login_or_token=self.token,
+                                     pool_size=HTTP_POOL_SIZE)
             else:
                 # Regular GitHub.com
-                self.github = Github(self.token)
+                self.api_url = "https://api.github.com"
+                self.github = Github(self.token, pool_size=HTTP_POOL_SIZE)
+
+            if self._session is None:
+                self._session = self._create_session()
+
+            # Reuse the repository resolved by a previous session if still valid
+            if self.repository_name:
+                cached = self._load_connection_cache()
+                if cached:
+                    # Lazy repository object: no request until it is used
+                    self.repo = self.github.get_repo(cached['full_name'], lazy=True)
+                    self._repo_url = f"{self.api_url}/repos/{cached['full_name']}"
+                    self.enabled = True
+                    logger.info(f"Connected to repository: {cached['full_name']} "
+                                f"(cached, user: {cached['login']})")
+                    return True
 
             # Verify token by getting user
-            user = self.github.get_user()
+            user = self._get_auth_user()
             logger.info(f"Connected to GitHub as: {user.login}")
 
             # Get or create repository
             if self.repository_name:
                 self.repo = self._get_or_create_repo()
                 if self.repo:
+                    self._repo_url = f"{self.api_url}/repos/{self.repo.full_name}"
                     self.enabled = True
+                    self._save_connection_cache(self.repo.full_name, user.login)
                     logger.info(f"Connected to repository: {self.repository_name}")
                     return True
 
@@ -78,11 +296,157 @@ class GitHubSyncService:
 
         except GithubException as e:
             logger.error(f"GitHub connection failed: {e}")
+            self._invalidate_connection_cache()
             return False
         except Exception as e:
             logger.error(f"Unexpected error during GitHub connection: {e}")
             return False
 
+    def _connection_cache_key(self) -> str:
+        """Fingerprint of the settings a cached connection belongs to (never stores the token)"""
+        raw = f"{self.token}\n{self.api_url}\n{self.repository_name}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _load_connection_cache(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached connection for the current token and repository
+
+        Returns:
+            Dict with 'full_name' and 'login', or None if missing or stale
+        """
+        try:
+            with open(CONNECTION_CACHE_FILE, 'rb') as f:
+                cached = json_codec.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if cached.get('key') != self._connection_cache_key():
+            return None
+        if time.time() - cached.get('cached_at', 0) > CONNECTION_CACHE_TTL:
+            return None
+
+        return cached
+
+    def _save_connection_cache(self, full_name: str, login: str):
+        """
+        Cache the resolved repository and user login
+
+        Args:
+            full_name: Repository full name (owner/repo)
+            login: Authenticated user login
+        """
+        try:
+            os.makedirs(os.path.dirname(CONNECTION_CACHE_FILE), exist_ok=True)
+            with open(CONNECTION_CACHE_FILE, 'wb') as f:
+                f.write(json_codec.dumps({
+                    'key': self._connection_cache_key(),
+                    'full_name': full_name,
+                    'login': login,
+                    'cached_at': time.time()
+                }))
+        except OSError as e:
+            logger.debug(f"Could not write connection cache: {e}")
+
+    def _invalidate_connection_cache(self):
+        """Remove the cached connection (e.g. after the token was rejected)"""
+        self._last_ok_ts = None
+        try:
+            os.remove(CONNECTION_CACHE_FILE)
+            logger.info("GitHub connection cache invalidated")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not remove connection cache: {e}")
+
+    def _create_session(self) -> "requests.Session":
+        """
+        Create the HTTP session shared by all direct requests of this service.
+        Its connection pool is shared process-wide, so TCP/TLS connections
+        stay alive between calls and across service instances.
+
+        Returns:
+            Session with authentication headers set
+        """
+        import requests
+
+        session = requests.Session()
+        session.headers.update({'Authorization': f'token {self.token}'})
+
+        adapter = _get_shared_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self):
+        """Stop the background threads and close the shared HTTP session"""
+        self._executor.shutdown(wait=False)
+        if self._session:
+            # The pool is shared with other instances - keep Session.close() off it
+            self._session.adapters.clear()
+            self._session.close()
+            self._session = None
+
+    def _request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """
+        Send a direct request through the shared session, paced by the rate
+        limiter and retried with exponential backoff when GitHub throttles us
+
+        Args:
+            method: HTTP method
+            url: Absolute API URL
+            **kwargs: Passed to requests.Session.request
+
+        Returns:
+            Response (the last one if retries ran out or GitHub asked us to
+            wait longer than RATE_LIMIT_MAX_WAIT)
+
+        Raises:
+            RateLimitedError: If the remaining quota is exhausted for longer
+                than RATE_LIMIT_MAX_WAIT
+        """
+        kwargs.setdefault('timeout', HTTP_TIMEOUT)
+        backoff = 1
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            self._limiter.acquire()
+            response = self._session.request(method, url, **kwargs)
+            self._limiter.update(response.headers)
+
+            throttled = response.status_code == 429 or (
+                response.status_code == 403 and (
+                    'Retry-After' in response.headers
+                    or response.headers.get('X-RateLimit-Remaining') == '0'
+                )
+            )
+            if not throttled or attempt == RATE_LIMIT_MAX_RETRIES:
+                return response
+
+            try:
+                delay = int(response.headers['Retry-After'])
+            except (KeyError, ValueError):
+                delay = backoff
+            backoff *= 2
+            if delay > RATE_LIMIT_MAX_WAIT:
+                # Don't hold the caller that long - let it fail and retry later
+                logger.warning(f"GitHub rate limited ({response.status_code}), retry in {delay}s")
+                return response
+
+            logger.warning(f"GitHub rate limited ({response.status_code}), retrying in {delay}s")
+            time.sleep(delay)
+
+        return response
+
+    def _get_auth_user(self):
+        """
+        Get the authenticated user, fetching it only once per connection
+
+        Returns:
+            PyGithub AuthenticatedUser
+        """
+        if self._auth_user is None:
+            self._auth_user = self.github.get_user()
+        return self._auth_user
+
     def _get_or_create_repo(self):
         """
         Get existing repository or create new one
@@ -90,6 +454,8 @@ class GitHubSyncService:
         Returns:
             Repository object or None
         """
+        from github import GithubException
+
         try:
             # Try to get existing repo
             repo = self.github.get_repo(self.repository_name)
@@ -100,7 +466,7 @@ class GitHubSyncService:
             logger.debug(f"Repository not found with full name, trying to create: {e}")
             # Repository doesn't exist, try to create it
             try:
-                user = self.github.get_user()
+                user = self._get_auth_user()
                 repo_name = self.repository_name.split('/')[-1]
 
                 # Check if repo exists under user account
@@ -124,7 +490,7 @@ class GitHubSyncService:
                 # If creation failed due to already exists, try to get it one more time
                 if "already exists" in str(e).lower():
                     try:
-                        user = self.github.get_user()
+                        user = self._get_auth_user()
                         repo_name = self.repository_name.split('/')[-1]
                         repo = self.github.get_repo(f"{user.login}/{repo_name}")
                         logger.info(f"Found existing repository after creation failed: {user.login}/{repo_name}")
@@ -133,6 +499,227 @@ class GitHubSyncService:
                         logger.debug(f"Retry to get existing repo also failed: {retry_error}")
                 return None
 
+    def _create_blob(self, content: bytes) -> str:
+        """
+        Upload raw content as a Git blob
+
+        Args:
+            content: File content
+
+        Returns:
+            SHA of the created blob
+        """
+        blob = self.repo.create_git_blob(base64.b64encode(content).decode('ascii'), 'base64')
+        return blob.sha
+
+    def _commit_files(self, files: Dict[str, Optional[bytes]], message: str) -> str:
+        """
+        Write and/or delete several files in a single commit using the Git Data API
+        (blobs + one tree + one commit + one ref update, instead of a
+        Contents API GET/PUT pair per file). The branch head is remembered
+        between commits and only looked up again when the branch has moved.
+
+        Args:
+            files: Mapping of repository path to new content, or None to delete the path
+            message: Commit message
+
+        Returns:
+            SHA of the new commit
+
+        Raises:
+            GithubException: If any API call fails (the branch is left untouched)
+            requests.RequestException: If the branch can't be updated
+        """
+        from github import InputGitTreeElement
+
+        # Blobs are independent, so upload them concurrently
+        writes = {path: content for path, content in files.items() if content is not None}
+        with ThreadPoolExecutor(max_workers=BLOB_UPLOAD_WORKERS) as executor:
+            blob_shas = dict(zip(writes, executor.map(self._create_blob, writes.values())))
+
+        # A tree entry with sha=None deletes the path
+        elements = [
+            InputGitTreeElement(path=path, mode='100644', type='blob', sha=blob_shas.get(path))
+            for path in files
+        ]
+        branch = self.repo.default_branch
+
+        for attempt in range(2):
+            if attempt or self._head_commit is None:
+                ref = self.repo.get_git_ref(f"heads/{branch}")
+                self._head_commit = self.repo.get_git_commit(ref.object.sha)
+            head = self._head_commit
+
+            tree = self.repo.create_git_tree(elements, base_tree=head.tree)
+            commit = self.repo.create_git_commit(message, tree, [head])
+
+            response = self._request(
+                'PATCH', f"{self._repo_url}/git/refs/heads/{branch}",
+                data=json_codec.dumps({'sha': commit.sha}),
+                headers={'Content-Type': 'application/json'}
+            )
+            # 422: not a fast-forward - the branch moved past our cached head
+            if response.status_code == 422 and attempt == 0:
+                logger.debug("Branch moved since last commit, retrying on new head")
+                continue
+            response.raise_for_status()
+            break
+
+        self._head_commit = commit
+        return commit.sha
+
+    def _get_json_file(self, path: str, raw: bool = True) -> Optional[Any]:
+        """
+        Fetch and parse a JSON file from the repository using a conditional GET.
+        The raw media type returns the file body directly (no base64 envelope,
+        no 1MB limit); an unchanged file answers 304 and is re-parsed from the
+        cached body. 304 responses don't count against the rate limit.
+
+        Args:
+            path: Path of the file (or folder) in the repository
+            raw: Request the raw file body; False returns the contents API
+                metadata instead (e.g. a folder listing)
+
+        Returns:
+            Parsed JSON, or None if the file doesn't exist or is empty
+
+        Raises:
+            requests.RequestException: On HTTP errors
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        headers = {'Accept': 'application/vnd.github.raw'} if raw else {}
+        cached = self._etag_cache.get(path)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = self._request('GET', f"{self._repo_url}/contents/{path}",
+                                 headers=headers)
+
+        if response.status_code == 304:
+            logger.debug(f"Unchanged since last download: {path}")
+            return json_codec.loads(cached[1])
+
+        if response.status_code == 404:
+            self._etag_cache.pop(path, None)
+            return None
+
+        if response.status_code == 401:
+            # Token rejected - next connect() must not trust the cache
+            self._invalidate_connection_cache()
+
+        response.raise_for_status()
+
+        if not response.content.strip():
+            logger.warning(f"File is empty: {path}")
+            return None
+
+        data = json_codec.loads(response.content)
+
+        etag = response.headers.get('ETag')
+        if etag and len(response.content) <= ETAG_BODY_CACHE_MAX:
+            self._etag_cache[path] = (etag, response.content)
+        else:
+            self._etag_cache.pop(path, None)
+
+        return data
+
+    def _get_file_sha(self, path: str) -> Optional[str]:
+        """
+        Look up the blob SHA of a file from its parent folder listing
+        (the listing carries SHAs without downloading any file content)
+
+        Raises:
+            requests.RequestException: On HTTP errors
+
+        Args:
+            path: Path of the file in the repository
+
+        Returns:
+            Blob SHA, or None if the file doesn't exist
+        """
+        # Conditional GET: polling an unchanged folder costs no rate limit
+        listing = self._get_json_file(os.path.dirname(path), raw=False)
+
+        for item in listing or []:
+            if item['path'] == path:
+                return item['sha']
+        return None
+
+    @staticmethod
+    def _git_blob_sha(content: bytes) -> str:
+        """
+        Compute the Git blob SHA of content, as GitHub reports it for files
+
+        Args:
+            content: File content
+
+        Returns:
+            Hex SHA-1 of the blob object
+        """
+        header = f"blob {len(content)}\0".encode('ascii')
+        return hashlib.sha1(header + content).hexdigest()
+
+    def _put_file(self, path: str, content: bytes, message: str) -> Tuple[str, bool]:
+        """
+        Create or update a file with a single PUT to the contents API.
+        The content is base64-encoded once and the request body is
+        serialized once, instead of going through PyGithub's str round trips.
+
+        Args:
+            path: Path of the file in the repository
+            content: File content
+            message: Commit message
+
+        Returns:
+            Tuple of (new blob SHA, whether the file was created)
+
+        Raises:
+            requests.RequestException: On HTTP errors
+        """
+        # Compare against the file as it is on the server now (another device
+        # may have overwritten our last write); the conditional listing is free
+        # when the folder is unchanged
+        sha = self._get_file_sha(path)
+        if sha and sha == self._git_blob_sha(content):
+            logger.debug(f"Content unchanged, skipping upload: {path}")
+            self._file_shas[path] = sha
+            return sha, False
+
+        url = f"{self._repo_url}/contents/{path}"
+        body = {
+            'message': message,
+            'content': base64.b64encode(content).decode('ascii')
+        }
+
+        for attempt in range(2):
+            if sha:
+                body['sha'] = sha
+            else:
+                body.pop('sha', None)
+
+            response = self._request(
+                'PUT', url,
+                data=json_codec.dumps(body),
+                headers={'Content-Type': 'application/json'}
+            )
+
+            # 409/422: our SHA is stale or missing - look it up once and retry
+            if response.status_code in (409, 422) and attempt == 0:
+                sha = self._get_file_sha(path)
+                continue
+            break
+
+        if response.status_code == 401:
+            # Token rejected - next connect() must not trust the cache
+            self._invalidate_connection_cache()
+
+        response.raise_for_status()
+
+        new_sha = json_codec.loads(response.content)['content']['sha']
+        self._file_shas[path] = new_sha
+        self._head_commit = None  # The contents API committed behind our back
+        return new_sha, response.status_code == 201
+
     def upload_backup(self, data: Dict[str, Any], filename: Optional[str] = None) -> bool:
         """
         Upload encrypted backup to GitHub (always uses single file for sync)
@@ -152,29 +739,14 @@ class GitHubSyncService:
             # Always use the same file for sync (Primary Storage mode)
             filepath = "backups/clipboard_sync.json"
 
-            # Convert data to JSON
-            content = json.dumps(data, indent=2)
+            content = json_codec.dumps(data)
+            _, created = self._put_file(filepath, content, "Update clipboard sync data")
+            self._backups_checked_at = None
 
-            # Check if file exists
-            try:
-                existing_file = self.repo.get_contents(filepath)
-                # Update existing file
-                self.repo.update_file(
-                    path=filepath,
-                    message="Update clipboard sync data",
-                    content=content,
-                    sha=existing_file.sha
-                )
-                logger.info(f"Updated sync file: {filepath}")
-
-            except GithubException:
-                # Create new file
-                self.repo.create_file(
-                    path=filepath,
-                    message="Initial clipboard sync data",
-                    content=content
-                )
+            if created:
                 logger.info(f"Created new backup file: {filepath}")
+            else:
+                logger.info(f"Updated sync file: {filepath}")
 
             return True
 
@@ -182,6 +754,63 @@ class GitHubSyncService:
             logger.error(f"Failed to upload backup: {e}")
             return False
 
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Run a blocking sync call on the service's background threads
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future with the result of fn
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def upload_backup_async(self, data: Dict[str, Any],
+                            filename: Optional[str] = None) -> Future:
+        """
+        Upload backup without blocking the caller (see upload_backup)
+
+        Args:
+            data: Data to upload (should be encrypted)
+            filename: Ignored - always uses clipboard_sync.json
+
+        Returns:
+            Future resolving to True if successful
+        """
+        return self.submit(self.upload_backup, data, filename)
+
+    def upload_backups_bulk(self, backups: List[Tuple[str, Dict[str, Any]]]) -> bool:
+        """
+        Upload several backups to the backups folder in a single commit
+
+        Args:
+            backups: List of (filename, data) tuples; data should be encrypted
+
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not self.repo:
+            logger.warning("GitHub sync not enabled")
+            return False
+
+        if not backups:
+            return True
+
+        try:
+            files = {f"backups/{filename}": json_codec.dumps(data) for filename, data in backups}
+            commit_sha = self._commit_files(files, f"Upload {len(files)} clipboard backups")
+            self._backups_checked_at = None
+
+            logger.info(f"Uploaded {len(files)} backups in one commit ({commit_sha[:8]})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to upload backups: {e}")
+            return False
+
     def download_backup(self, filename: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Download backup from GitHub (always uses single file for sync)
@@ -199,48 +828,92 @@ class GitHubSyncService:
         try:
             # Always use the same file for sync (Primary Storage mode)
             filepath = "backups/clipboard_sync.json"
-            file_content = self.repo.get_contents(filepath)
+            data = self._get_json_file(filepath)
 
-            # Handle large files (>1MB) - GitHub returns encoding: none
-            if file_content.encoding is None or file_content.encoding == 'none':
-                # Use download_url for large files
-                logger.debug(f"Large file detected ({file_content.size} bytes), using download_url")
-                headers = {'Authorization': f'token {self.token}'}
-                response = requests.get(file_content.download_url, headers=headers, timeout=30)
-                response.raise_for_status()
-                content = response.text
-            else:
-                # Use decoded_content for smaller files
-                content = file_content.decoded_content.decode('utf-8')
-
-            if not content or not content.strip():
-                logger.warning(f"Backup file is empty: {filepath}")
+            if data is None:
+                logger.debug(f"Backup file not found or empty: {filepath}")
                 return None
 
-            data = json.loads(content)
-
             logger.info(f"Downloaded backup: {filepath} ({len(data.get('entries', []))} entries)")
             return data
 
-        except GithubException as e:
-            if e.status == 404:
-                logger.debug(f"Backup file not found: backups/clipboard_sync.json")
-            else:
-                logger.error(f"GitHub API error: {e}")
-            return None
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in backup file: {e}")
             return None
-        except requests.RequestException as e:
-            logger.error(f"Failed to download large file: {e}")
-            return None
         except Exception as e:
             logger.error(f"Failed to download backup: {e}")
             return None
 
-    def list_backups(self) -> List[Dict[str, Any]]:
+    def _fetch_backups(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
-        List available backups
+        Fetch metadata of the files in the backups folder, unsorted.
+        Reads the folder's Git tree (names, sizes and SHAs in one compact
+        response, without the contents API's 1000-entry cap) with a
+        conditional GET: an unchanged folder answers 304 with no body.
+
+        Args:
+            refresh: Ask the server even if the cached listing is still fresh
+
+        Returns:
+            List of backup metadata (shared with the cache - don't modify)
+
+        Raises:
+            requests.RequestException: On HTTP errors
+        """
+        now = time.monotonic()
+        if (self._backups_cache and not refresh and self._backups_checked_at is not None
+                and now - self._backups_checked_at < BACKUPS_CACHE_TTL):
+            return self._backups_cache[1]
+
+        headers = {}
+        if self._backups_cache:
+            headers['If-None-Match'] = self._backups_cache[0]
+
+        response = self._request(
+            'GET', f"{self._repo_url}/git/trees/HEAD:backups",
+            headers=headers
+        )
+
+        if response.status_code == 304:
+            logger.debug("Backups folder unchanged, using cached listing")
+            self._backups_checked_at = now
+            return self._backups_cache[1]
+
+        if response.status_code in (404, 422):
+            # Backups folder doesn't exist yet
+            logger.info("No backups folder found")
+            self._backups_cache = None
+            return []
+
+        response.raise_for_status()
+
+        last_modified = response.headers.get('Last-Modified')
+        backups = [
+            {
+                'filename': item['path'],
+                'path': f"backups/{item['path']}",
+                'size': item['size'],
+                'sha': item['sha'],
+                'last_modified': last_modified
+            }
+            for item in json_codec.loads(response.content)['tree']
+            if item['type'] == 'blob' and item['path'].endswith('.json')
+        ]
+
+        etag = response.headers.get('ETag')
+        self._backups_cache = (etag, backups) if etag else None
+        self._backups_checked_at = now
+
+        return backups
+
+    def list_backups(self, limit: Optional[int] = None,
+                     refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        List available backups, newest filename first
+
+        Args:
+            limit: Return only the first N backups (None for all)
+            refresh: Bypass the short-lived listing cache
 
         Returns:
             List of backup metadata
@@ -250,26 +923,13 @@ class GitHubSyncService:
             return []
 
         try:
-            backups = []
-
-            try:
-                contents = self.repo.get_contents("backups")
+            backups = self._fetch_backups(refresh)
 
-                for file in contents:
-                    if file.name.endswith('.json'):
-                        backups.append({
-                            'filename': file.name,
-                            'path': file.path,
-                            'size': file.size,
-                            'sha': file.sha,
-                            'last_modified': file.last_modified
-                        })
+            if limit is not None:
+                # Partial sort: O(N log limit) instead of sorting everything
+                return heapq.nlargest(limit, backups, key=itemgetter('filename'))
 
-            except GithubException:
-                # Backups folder doesn't exist yet
-                logger.info("No backups folder found")
-
-            return sorted(backups, key=lambda x: x['filename'], reverse=True)
+            return sorted(backups, key=itemgetter('filename'), reverse=True)
 
         except Exception as e:
             logger.error(f"Failed to list backups: {e}")
@@ -298,6 +958,8 @@ class GitHubSyncService:
                 message=f"Delete backup: {filename}",
                 sha=file_content.sha
             )
+            self._file_shas.pop(filepath, None)
+            self._backups_checked_at = None
 
             logger.info(f"Deleted backup: {filepath}")
             return True
@@ -306,6 +968,39 @@ class GitHubSyncService:
             logger.error(f"Failed to delete backup: {e}")
             return False
 
+    def delete_backups_bulk(self, filenames: List[str]) -> bool:
+        """
+        Delete several backups from GitHub in a single commit
+
+        Args:
+            filenames: Names of backup files
+
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not self.repo:
+            logger.warning("GitHub sync not enabled")
+            return False
+
+        try:
+            # Deleting a path that isn't in the tree fails the whole commit
+            existing = {b['filename'] for b in self._fetch_backups(refresh=True)}
+            paths = [f"backups/{name}" for name in filenames if name in existing]
+            if not paths:
+                return True
+
+            commit_sha = self._commit_files(dict.fromkeys(paths), f"Delete {len(paths)} backups")
+            for path in paths:
+                self._file_shas.pop(path, None)
+            self._backups_checked_at = None
+
+            logger.info(f"Deleted {len(paths)} backups in one commit ({commit_sha[:8]})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete backups: {e}")
+            return False
+
     def sync_settings(self, settings: Dict[str, Any]) -> bool:
         """
         Sync application settings to GitHub
@@ -321,25 +1016,10 @@ class GitHubSyncService:
 
         try:
             filepath = "settings.json"
-            content = json.dumps(settings, indent=2)
-
-            try:
-                # Update existing settings
-                existing_file = self.repo.get_contents(filepath)
-                self.repo.update_file(
-                    path=filepath,
-                    message="Update application settings",
-                    content=content,
-                    sha=existing_file.sha
-                )
+            content = json_codec.dumps(settings)
 
-            except GithubException:
-                # Create new settings file
-                self.repo.create_file(
-                    path=filepath,
-                    message="Add application settings",
-                    content=content
-                )
+            # Update-first with the SHA of our last write (GET only on conflict)
+            self._put_file(filepath, content, "Update application settings")
 
             logger.info("Settings synced to GitHub")
             return True
@@ -359,34 +1039,48 @@ class GitHubSyncService:
             return None
 
         try:
-            file_content = self.repo.get_contents("settings.json")
-            content = base64.b64decode(file_content.content).decode('utf-8')
-            settings = json.loads(content)
+            settings = self._get_json_file("settings.json")
+            if settings is None:
+                logger.info("No settings file found on GitHub")
+                return None
 
             logger.info("Settings retrieved from GitHub")
             return settings
 
-        except GithubException:
-            logger.info("No settings file found on GitHub")
-            return None
         except Exception as e:
             logger.error(f"Failed to get settings: {e}")
             return None
 
     def test_connection(self) -> bool:
         """
-        Test GitHub connection
+        Test GitHub connection.
+        Uses the small /rate_limit endpoint, which doesn't count against the
+        rate limit; a success is reused for CONNECTION_CHECK_TTL seconds.
 
         Returns:
             True if connection is working
         """
         try:
-            if not self.github:
+            if not self.github or not self._session:
+                return False
+
+            now = time.monotonic()
+            if self._last_ok_ts is not None and now - self._last_ok_ts < CONNECTION_CHECK_TTL:
+                return True
+
+            response = self._request('GET', f"{self.api_url}/rate_limit")
+            if response.status_code == 404:
+                # Enterprise servers with rate limiting disabled - check the token instead
+                response = self._request('GET', f"{self.api_url}/user")
+
+            if response.status_code in (401, 403):
+                self._invalidate_connection_cache()
+                logger.error(f"Connection test failed: HTTP {response.status_code}")
                 return False
 
-            # Try to get user info
-            user = self.github.get_user()
-            return user is not None
+            response.raise_for_status()
+            self._last_ok_ts = now
+            return True
 
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
@@ -403,7 +1097,8 @@ class GitHubSyncService:
             return {}
 
         try:
-            backups = self.list_backups()
+            # Order doesn't matter here, so skip the sort in list_backups()
+            backups = self._fetch_backups()
             total_size = sum(b['size'] for b in backups)
 
             return {
@@ -420,13 +1115,16 @@ class GitHubSyncService:
     # Real-time Sync Methods (Push/Pull with latest.json)
     # =====================================================
 
-    def push_latest(self, data: Dict[str, Any]) -> bool:
+    def push_latest(self, data: Dict[str, Any],
+                    settings: Optional[Dict[str, Any]] = None) -> bool:
         """
         Push latest clipboard data to GitHub (real-time sync).
-        Uses a single file (sync/latest.json) for efficient updates.
+        Uses a single file (sync/latest.json) as a full snapshot; pending
+        deltas are removed in the same commit.
 
         Args:
             data: Encrypted data to upload (should contain 'entries' list)
+            settings: Optional settings to write in the same commit
 
         Returns:
             True if successful
@@ -436,29 +1134,38 @@ class GitHubSyncService:
             return False
 
         try:
-            content = json.dumps(data, indent=2)
-
-            try:
-                # Try to update existing file
-                existing_file = self.repo.get_contents(LATEST_SYNC_FILE)
-                self.repo.update_file(
-                    path=LATEST_SYNC_FILE,
-                    message="Sync clipboard data",
-                    content=content,
-                    sha=existing_file.sha
+            content = json_codec.dumps(data)
+
+            files: Dict[str, Optional[bytes]] = {}
+            if settings is not None:
+                files["settings.json"] = json_codec.dumps(settings)
+
+            # The snapshot supersedes the deltas already merged locally - prune
+            # them in the same commit (unseen ones may hold entries we lack)
+            self._list_deltas()
+            files.update(dict.fromkeys(p for p in self._delta_paths if p in self._seen_deltas))
+
+            if files:
+                # Several paths in one commit via the Git Data API
+                files[LATEST_SYNC_FILE] = content
+                commit_sha = self._commit_files(files, "Sync clipboard data")
+                self._file_shas.update(
+                    (path, self._git_blob_sha(file_content))
+                    for path, file_content in files.items() if file_content is not None
                 )
-                self._last_sync_sha = existing_file.sha
-                logger.debug(f"Updated sync file: {LATEST_SYNC_FILE}")
+                self._last_sync_sha = self._file_shas[LATEST_SYNC_FILE]
+                self._delta_paths = [p for p in self._delta_paths if p not in files]
+                logger.debug(f"Pushed sync snapshot ({commit_sha[:8]})")
+                return True
 
-            except GithubException:
-                # Create new file (first time)
-                result = self.repo.create_file(
-                    path=LATEST_SYNC_FILE,
-                    message="Initial clipboard sync",
-                    content=content
-                )
-                self._last_sync_sha = result['content'].sha
+            self._last_sync_sha, created = self._put_file(
+                LATEST_SYNC_FILE, content, "Sync clipboard data"
+            )
+
+            if created:
                 logger.info(f"Created sync file: {LATEST_SYNC_FILE}")
+            else:
+                logger.debug(f"Updated sync file: {LATEST_SYNC_FILE}")
 
             return True
 
@@ -466,6 +1173,129 @@ class GitHubSyncService:
             logger.error(f"Failed to push latest: {e}")
             return False
 
+    def _list_deltas(self) -> List[str]:
+        """
+        List delta files, oldest first, from the deltas folder's Git tree
+        (conditional GET - an unchanged folder answers 304)
+
+        Returns:
+            Repository paths of the delta files
+
+        Raises:
+            requests.RequestException: On HTTP errors
+        """
+        key = f"tree:{DELTAS_FOLDER}"
+        headers = {}
+        cached = self._etag_cache.get(key)
+        if cached:
+            headers['If-None-Match'] = cached[0]
+
+        response = self._request('GET', f"{self._repo_url}/git/trees/HEAD:{DELTAS_FOLDER}",
+                                 headers=headers)
+
+        if response.status_code == 304:
+            paths = cached[1]
+        elif response.status_code in (404, 422):
+            # No deltas since the last snapshot
+            self._etag_cache.pop(key, None)
+            self._deltas_tree_sha = None
+            paths = []
+        else:
+            response.raise_for_status()
+            tree = json_codec.loads(response.content)
+            self._deltas_tree_sha = tree['sha']
+            # Names are nanosecond timestamps, so name order is push order
+            paths = sorted(
+                f"{DELTAS_FOLDER}/{item['path']}"
+                for item in tree['tree']
+                if item['type'] == 'blob'
+            )
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[key] = (etag, paths)
+
+        self._delta_paths = list(paths)
+        return self._delta_paths
+
+    def needs_snapshot(self) -> bool:
+        """
+        Check whether enough deltas piled up that the next push should be
+        a full snapshot (push_latest) instead of another delta
+
+        Returns:
+            True if a snapshot is due
+        """
+        return len(self._delta_paths) >= DELTA_SNAPSHOT_THRESHOLD
+
+    def push_delta(self, data: Dict[str, Any]) -> bool:
+        """
+        Push only the entries added since the last push (real-time sync).
+        Uploads O(new entries) instead of the whole history.
+
+        Args:
+            data: Encrypted data to upload (should contain the new 'entries')
+
+        Returns:
+            True if successful
+        """
+        if not self.enabled or not self.repo:
+            logger.warning("GitHub sync not enabled")
+            return False
+
+        try:
+            path = f"{DELTAS_FOLDER}/{time.time_ns()}.json"
+            self._put_file(path, json_codec.dumps(data), "Sync clipboard delta")
+
+            # Delta files are never rewritten, and we don't need to pull our own
+            self._file_shas.pop(path, None)
+            self._seen_deltas.add(path)
+            self._delta_paths.append(path)
+
+            logger.debug(f"Pushed sync delta: {path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to push delta: {e}")
+            return False
+
+    def pull_deltas(self) -> List[Dict[str, Any]]:
+        """
+        Pull delta files pushed by other devices since the last pull.
+        Apply them on top of the snapshot from pull_latest().
+
+        Returns:
+            List of data dicts, oldest first (empty if none/error)
+        """
+        if not self.enabled or not self.repo:
+            logger.debug("GitHub sync not enabled")
+            return []
+
+        try:
+            paths = self._list_deltas()
+            unseen = [path for path in paths if path not in self._seen_deltas]
+
+            # Deltas are independent files - download them concurrently
+            # (each request still takes a token from the rate limiter)
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+                results = list(executor.map(self._get_json_file, unseen))
+
+            for path in unseen:
+                # Deltas never change, so don't keep their bodies cached
+                self._etag_cache.pop(path, None)
+            self._seen_deltas.update(unseen)
+            deltas = [data for data in results if data is not None]
+
+            # Forget deltas that a snapshot has pruned
+            self._seen_deltas.intersection_update(paths)
+
+            if deltas:
+                logger.debug(f"Pulled {len(deltas)} sync deltas")
+            return deltas
+
+        except Exception as e:
+            logger.error(f"Failed to pull deltas: {e}")
+            return []
+
     def pull_latest(self) -> Optional[Dict[str, Any]]:
         """
         Pull latest clipboard data from GitHub.
@@ -478,29 +1308,29 @@ class GitHubSyncService:
             return None
 
         try:
-            file_content = self.repo.get_contents(LATEST_SYNC_FILE)
+            # Cheap change check: conditional GET of the folder listing
+            sha = self._get_file_sha(LATEST_SYNC_FILE)
+            if sha is None:
+                logger.debug("No sync file found on GitHub")
+                return None
 
             # Check if file has changed since last pull
-            if self._last_sync_sha and file_content.sha == self._last_sync_sha:
+            if self._last_sync_sha and sha == self._last_sync_sha:
                 logger.debug("No changes detected (same SHA)")
                 return None
 
-            # Decode and parse content
-            content = base64.b64decode(file_content.content).decode('utf-8')
-            data = json.loads(content)
+            # Raw body: parsed straight from bytes, no base64 envelope
+            data = self._get_json_file(LATEST_SYNC_FILE)
+            if data is None:
+                logger.debug("No sync file found on GitHub")
+                return None
 
             # Update last known SHA
-            self._last_sync_sha = file_content.sha
+            self._last_sync_sha = sha
 
-            logger.debug(f"Pulled latest sync data (SHA: {file_content.sha[:8]})")
+            logger.debug(f"Pulled latest sync data (SHA: {sha[:8]})")
             return data
 
-        except GithubException as e:
-            if e.status == 404:
-                logger.debug("No sync file found on GitHub")
-            else:
-                logger.error(f"Failed to pull latest: {e}")
-            return None
         except Exception as e:
             logger.error(f"Failed to pull latest: {e}")
             return None
@@ -508,7 +1338,9 @@ class GitHubSyncService:
     def check_for_updates(self) -> bool:
         """
         Check if there are updates on GitHub without downloading content.
-        Uses SHA comparison for efficiency (minimal API usage).
+        One conditional GET of the sync folder listing covers both the
+        snapshot and the deltas folder (whose tree SHA changes with every
+        delta); an unchanged folder answers 304 with no rate limit cost.
 
         Returns:
             True if updates are available
@@ -517,23 +1349,23 @@ class GitHubSyncService:
             return False
 
         try:
-            file_content = self.repo.get_contents(LATEST_SYNC_FILE)
+            listing = self._get_json_file(os.path.dirname(LATEST_SYNC_FILE), raw=False)
+            shas = {item['path']: item['sha'] for item in listing or []}
+            latest_sha = shas.get(LATEST_SYNC_FILE)
+            deltas_sha = shas.get(DELTAS_FOLDER)
 
-            if self._last_sync_sha is None:
-                # First check, updates available
-                return True
+            if latest_sha is None and deltas_sha is None:
+                return False  # No sync files exist
 
-            has_updates = file_content.sha != self._last_sync_sha
+            # Both SHAs start out None, so a first check reports whatever exists;
+            # deltas without a snapshot stop reporting once they've been pulled
+            has_updates = latest_sha != self._last_sync_sha or deltas_sha != self._deltas_tree_sha
             if has_updates:
-                logger.debug(f"Updates available (remote: {file_content.sha[:8]}, local: {self._last_sync_sha[:8]})")
+                logger.debug(f"Updates available (remote: {(latest_sha or '')[:8]}, "
+                             f"local: {(self._last_sync_sha or '')[:8]})")
 
             return has_updates
 
-        except GithubException as e:
-            if e.status == 404:
-                return False  # No sync file exists
-            logger.error(f"Failed to check for updates: {e}")
-            return False
         except Exception as e:
             logger.error(f"Failed to check for updates: {e}")
             return False
@@ -553,16 +1385,12 @@ class GitHubSyncService:
             return [], local_hashes
 
         try:
-            entries = data.get('entries', [])
-            remote_hashes = set()
-            new_entries = []
+            pairs = [(entry.get('content_hash'), entry) for entry in data.get('entries', [])]
+            remote_hashes = {content_hash for content_hash, _ in pairs if content_hash}
 
-            for entry in entries:
-                content_hash = entry.get('content_hash')
-                if content_hash:
-                    remote_hashes.add(content_hash)
-                    if content_hash not in local_hashes:
-                        new_entries.append(entry)
+            # One C-level set difference instead of a membership test per entry
+            new_hashes = remote_hashes - local_hashes
+            new_entries = [entry for content_hash, entry in pairs if content_hash in new_hashes]
 
             if new_entries:
                 logger.info(f"Found {len(new_entries)} new entries from remote")
@@ -581,4 +1409,5 @@ class GitHubSyncService:
         """Reset sync state (useful when switching devices)"""
         self._last_sync_sha = None
         self._known_hashes.clear()
+        self._seen_deltas.clear()
         logger.info("Sync state reset")
\ No newline at end of file
@@ -1,6 +1,18 @@
 """Dialog components for the UI"""
 
-from .github_settings_dialog import GitHubSettingsDialog
-from .app_settings_dialog import AppSettingsDialog
+# Dialogs are imported on first access (PEP 562), so importing one dialog
+# module - e.g. the welcome dialog at startup - doesn't load all of them
+_DIALOG_MODULES = {
+    'GitHubSettingsDialog': '.github_settings_dialog',
+    'AppSettingsDialog': '.app_settings_dialog',
+}
 
-__all__ = ['GitHubSettingsDialog', 'AppSettingsDialog']
\ No newline at end of file
+__all__ = ['GitHubSettingsDialog', 'AppSettingsDialog']
+
+
+def __getattr__(name):
+    if name in _DIALOG_MODULES:
+        import importlib
+        module = importlib.import_module(_DIALOG_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,15 +8,20 @@ from qfluentwidgets import (
     SwitchButton, isDarkTheme
 )
 from loguru import logger
-import yaml
+import copy
 import os
 
+from src.utils import yaml_codec
+
 
 class AppSettingsDialog(QDialog):
     """Dialog for configuring general application settings"""
 
     settings_saved = pyqtSignal(dict)  # Signal emitted when settings are saved
 
+    # (mtime, parsed settings) of the config file, shared by all instances
+    _settings_cache = None
+
     @property
     def _config_path(self) -> str:
         """Get config file path"""
@@ -70,13 +75,32 @@ class AppSettingsDialog(QDialog):
                 }
             """)
 
+    def _read_config(self) -> dict:
+        """
+        Read the config file, reusing the last parse while its mtime is unchanged
+
+        Returns:
+            Parsed settings (shared with the cache - copy before modifying)
+        """
+        if not os.path.exists(self._config_path):
+            return {}
+
+        mtime = os.path.getmtime(self._config_path)
+        cached = AppSettingsDialog._settings_cache
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with open(self._config_path, 'r', encoding='utf-8') as f:
+            settings = yaml_codec.load(f) or {}
+
+        AppSettingsDialog._settings_cache = (mtime, settings)
+        return settings
+
     def _load_current_settings(self) -> dict:
         """Load current settings from config"""
         try:
             if os.path.exists(self._config_path):
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    settings = yaml.safe_load(f) or {}
-                    return settings
+                return self._read_config()
 
         except Exception as e:
             logger.error(f"Failed to load settings: {e}")
@@ -151,10 +175,7 @@ class AppSettingsDialog(QDialog):
         """Save settings to config file"""
         try:
             # Load existing settings
-            settings = {}
-            if os.path.exists(self._config_path):
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    settings = yaml.safe_load(f) or {}
+            settings = copy.deepcopy(self._read_config())
 
             # Update UI settings
             if 'ui' not in settings:
@@ -165,7 +186,8 @@ class AppSettingsDialog(QDialog):
             # Save to file
             os.makedirs(os.path.dirname(self._config_path), exist_ok=True)
             with open(self._config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(settings, f, default_flow_style=False)
+                yaml_codec.dump(settings, f)
+            AppSettingsDialog._settings_cache = (os.path.getmtime(self._config_path), settings)
 
             logger.info(f"App settings saved: show_notifications={settings['ui']['show_notifications']}")
 
@@ -1,5 +1,6 @@
 """GitHub Backup Restore Dialog"""
 
+from concurrent.futures import Future
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from PyQt6.QtCore import Qt, pyqtSignal, QThread
@@ -10,29 +11,93 @@ from qfluentwidgets import (
     ListWidget, isDarkTheme, ProgressBar
 )
 from loguru import logger
-import yaml
 import os
+import re
+import time
+
+from src.core.clipboard.history import ClipboardEntry
+
+
+# auto_backup_/clipboard_backup_ + YYYYMMDD[_]HHMMSS + .json
+BACKUP_FILENAME_RE = re.compile(r'^(?:auto_backup_|clipboard_backup_)(\d{8})_?(\d{6})\.json$')
+
+# Entries written per database transaction during a restore
+RESTORE_BATCH_SIZE = 2000
+
+# Minimum seconds between restore progress updates sent to the UI thread
+PROGRESS_MIN_INTERVAL = 0.1
+
+# Theme stylesheets, built once at import rather than per dialog
+_DARK_QSS = """
+    QDialog {
+        background-color: #202020;
+        color: #ffffff;
+    }
+    QListWidget {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        color: #ffffff;
+    }
+    QListWidget::item:selected {
+        background-color: #0078d4;
+    }
+    QListWidget::item:hover {
+        background-color: #404040;
+    }
+"""
+
+_LIGHT_QSS = """
+    QDialog {
+        background-color: #f3f3f3;
+        color: #000000;
+    }
+    QListWidget {
+        background-color: #ffffff;
+        border: 1px solid #d4d4d4;
+        border-radius: 4px;
+        color: #000000;
+    }
+    QListWidget::item:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+    }
+    QListWidget::item:hover {
+        background-color: #e0e0e0;
+    }
+"""
 
 
 class RestoreWorker(QThread):
     """Worker thread for restore operation"""
 
     progress = pyqtSignal(str)
+    entries_restored = pyqtSignal(int, int)  # (restored so far, total)
     finished = pyqtSignal(bool, str)
 
-    def __init__(self, github_sync, filename, repository, encryption_manager):
+    def __init__(self, github_sync, filename, repository, encryption_manager,
+                 prefetched: Optional[Future] = None):
         super().__init__()
         self.github_sync = github_sync
         self.filename = filename
         self.repository = repository
         self.encryption_manager = encryption_manager
+        self.prefetched = prefetched  # download started while the user was choosing
 
     def run(self):
         """Run restore operation in background"""
         try:
-            # Download backup from GitHub
+            # Download backup from GitHub, reusing the prefetch if it worked
             self.progress.emit("Downloading backup from GitHub...")
-            backup_data = self.github_sync.download_backup(self.filename)
+            backup_data = None
+            if self.prefetched is not None:
+                try:
+                    backup_data = self.prefetched.result()
+                except Exception as e:
+                    logger.warning(f"Backup prefetch failed, downloading again: {e}")
+                self.prefetched = None
+            if not backup_data:
+                backup_data = self.github_sync.download_backup(self.filename)
 
             if not backup_data:
                 self.finished.emit(False, "Failed to download backup")
@@ -41,40 +106,76 @@ class RestoreWorker(QThread):
             # Decrypt the backup
             self.progress.emit("Decrypting backup data...")
             decrypted_data = self.encryption_manager.decrypt_json(backup_data)
+            # The ciphertext isn't needed any more; don't hold both copies
+            del backup_data
 
             if not decrypted_data:
                 self.finished.emit(False, "Failed to decrypt backup")
                 return
 
-            # Clear existing data
-            self.progress.emit("Clearing existing data...")
-            self.repository.clear_all()
+            entries = decrypted_data.pop('entries', [])
+            del decrypted_data
 
-            # Restore entries
-            entries = decrypted_data.get('entries', [])
-            total = len(entries)
+            # Clear and re-insert in one transaction: a failure part way keeps
+            # the current history instead of leaving it half restored
+            self.progress.emit("Restoring entries...")
+            restored_count = self.repository.replace_all(self._restored_batches(entries))
+            if restored_count < 0:
+                self.finished.emit(False, "Failed to save restored entries; existing history was kept")
+                return
 
-            for i, entry_data in enumerate(entries):
-                self.progress.emit(f"Restoring entry {i+1}/{total}...")
+            self.finished.emit(True, f"Successfully restored {restored_count} entries")
 
-                # Create ClipboardEntry from data
-                from src.core.clipboard.history import ClipboardEntry
-                entry = ClipboardEntry(
+        except Exception as e:
+            logger.error(f"Restore failed: {e}")
+            self.finished.emit(False, str(e))
+
+    def _restored_batches(self, entries: list):
+        """
+        Build clipboard entries from backup data, a batch at a time
+
+        Args:
+            entries: Entry dicts from the decrypted backup (consumed as it goes)
+
+        Yields:
+            Lists of ClipboardEntry with unique content hashes
+        """
+        total = len(entries)
+        fromisoformat = datetime.fromisoformat
+        calculate_hash = ClipboardEntry.calculate_hash
+        seen = set()  # hashes already queued; duplicates keep their first occurrence
+        self.entries_restored.emit(0, total)
+        last_emit = time.monotonic()
+
+        for start in range(0, total, RESTORE_BATCH_SIZE):
+            batch = entries[:RESTORE_BATCH_SIZE]
+            # Drop saved entries as we go so the decoded backup and the
+            # encrypted rows aren't all held in memory at once
+            del entries[:RESTORE_BATCH_SIZE]
+
+            restored = []
+            for entry_data in batch:
+                content_hash = entry_data.get('content_hash') or calculate_hash(entry_data['content'])
+                if content_hash in seen:
+                    continue
+                seen.add(content_hash)
+
+                restored.append(ClipboardEntry(
                     content=entry_data['content'],
-                    timestamp=datetime.fromisoformat(entry_data['timestamp']),
-                    content_hash=entry_data.get('content_hash'),
+                    timestamp=fromisoformat(entry_data['timestamp']),
+                    content_hash=content_hash,
                     category=entry_data.get('category'),
                     metadata=entry_data.get('metadata', {})
-                )
+                ))
 
-                # Save to database
-                self.repository.save_entry(entry)
+            yield restored
 
-            self.finished.emit(True, f"Successfully restored {total} entries")
-
-        except Exception as e:
-            logger.error(f"Restore failed: {e}")
-            self.finished.emit(False, str(e))
+            # Each emit is a cross-thread event plus a repaint; cap the rate
+            restored_count = start + len(batch)
+            now = time.monotonic()
+            if restored_count == total or now - last_emit >= PROGRESS_MIN_INTERVAL:
+                self.entries_restored.emit(restored_count, total)
+                last_emit = now
 
 
 class RestoreDialog(QDialog):
@@ -88,6 +189,7 @@ class RestoreDialog(QDialog):
         self.repository = repository
         self.encryption_manager = encryption_manager
         self.backups = []
+        self._prefetch: Optional[Future] = None
 
         self.setWindowTitle("Restore from GitHub Backup")
         self.setModal(True)
@@ -100,45 +202,7 @@ class RestoreDialog(QDialog):
 
     def _apply_theme_style(self):
         """Apply theme-aware styling"""
-        if isDarkTheme():
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #202020;
-                    color: #ffffff;
-                }
-                QListWidget {
-                    background-color: #2d2d2d;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 4px;
-                    color: #ffffff;
-                }
-                QListWidget::item:selected {
-                    background-color: #0078d4;
-                }
-                QListWidget::item:hover {
-                    background-color: #404040;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #f3f3f3;
-                    color: #000000;
-                }
-                QListWidget {
-                    background-color: #ffffff;
-                    border: 1px solid #d4d4d4;
-                    border-radius: 4px;
-                    color: #000000;
-                }
-                QListWidget::item:selected {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                }
-                QListWidget::item:hover {
-                    background-color: #e0e0e0;
-                }
-            """)
+        self.setStyleSheet(_DARK_QSS if isDarkTheme() else _LIGHT_QSS)
 
     def _setup_ui(self):
         """Setup the dialog UI"""
@@ -162,6 +226,8 @@ class RestoreDialog(QDialog):
 
         # Backup list
         self.backup_list = QListWidget()
+        # Every row is one line of text, so Qt can size them all from the first
+        self.backup_list.setUniformItemSizes(True)
         self.backup_list.itemDoubleClicked.connect(self._on_item_double_clicked)
         main_layout.addWidget(self.backup_list, 1)
 
@@ -179,7 +245,8 @@ class RestoreDialog(QDialog):
         button_layout.addStretch()
 
         self.refresh_button = PushButton("Refresh", self, FIF.SYNC)
-        self.refresh_button.clicked.connect(self._load_backups)
+        # Refresh always asks GitHub; opening the dialog may use the cached listing
+        self.refresh_button.clicked.connect(lambda: self._load_backups(refresh=True))
         button_layout.addWidget(self.refresh_button)
 
         self.restore_button = PrimaryPushButton("Restore", self, FIF.DOWNLOAD)
@@ -193,8 +260,13 @@ class RestoreDialog(QDialog):
 
         main_layout.addLayout(button_layout)
 
-    def _load_backups(self):
-        """Load available backups from GitHub"""
+    def _load_backups(self, refresh: bool = False):
+        """
+        Load available backups from GitHub
+
+        Args:
+            refresh: Bypass the sync service's short-lived listing cache
+        """
         try:
             self.backup_list.clear()
             self.backups = []
@@ -206,39 +278,61 @@ class RestoreDialog(QDialog):
                 return
 
             # Get list of backups
-            self.backups = self.github_sync.list_backups()
+            self.backups = self.github_sync.list_backups(refresh=refresh)
 
             if not self.backups:
                 self.info_label.setText("No backups found")
                 return
 
-            # Add to list widget
-            for backup in self.backups:
-                item = QListWidgetItem()
-                filename = backup['filename']
-                size_kb = backup['size'] / 1024
-
-                # Parse timestamp from filename
-                if filename.startswith('auto_backup_') or filename.startswith('clipboard_backup_'):
-                    try:
-                        date_str = filename.split('_')[-1].replace('.json', '')
-                        timestamp = datetime.strptime(date_str, "%Y%m%d_%H%M%S" if '_' in date_str else "%Y%m%d%H%M%S")
-                        date_display = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                    except:
+            # Add to list widget, repainting once at the end rather than per item
+            self.backup_list.setUpdatesEnabled(False)
+            self.backup_list.blockSignals(True)
+            try:
+                for backup in self.backups:
+                    item = QListWidgetItem()
+                    filename = backup['filename']
+                    size_kb = backup['size'] / 1024
+
+                    # Parse timestamp from filename
+                    match = BACKUP_FILENAME_RE.match(filename)
+                    if match:
+                        date_part, time_part = match.groups()
+                        date_display = (f"{date_part[:4]}-{date_part[4:6]}-{date_part[6:]} "
+                                        f"{time_part[:2]}:{time_part[2:4]}:{time_part[4:]}")
+                    else:
                         date_display = filename
-                else:
-                    date_display = filename
 
-                item.setText(f"{date_display} ({size_kb:.1f} KB)")
-                item.setData(Qt.ItemDataRole.UserRole, backup)
-                self.backup_list.addItem(item)
+                    item.setText(f"{date_display} ({size_kb:.1f} KB)")
+                    item.setData(Qt.ItemDataRole.UserRole, backup)
+                    self.backup_list.addItem(item)
+            finally:
+                self.backup_list.blockSignals(False)
+                self.backup_list.setUpdatesEnabled(True)
 
             self.info_label.setText(f"Found {len(self.backups)} backup(s)")
 
+            # Start downloading while the user picks and confirms; every backup
+            # currently resolves to the same sync file, so one prefetch covers them
+            self._cancel_prefetch()
+            self._prefetch = self.github_sync.submit(
+                self.github_sync.download_backup, self.backups[0]['filename']
+            )
+
         except Exception as e:
             logger.error(f"Failed to load backups: {e}")
             self.info_label.setText(f"Error: {str(e)}")
 
+    def _cancel_prefetch(self):
+        """Drop the pending backup prefetch, if any"""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+
+    def done(self, result: int):
+        """Release the prefetched backup when the dialog closes"""
+        self._cancel_prefetch()
+        super().done(result)
+
     def _on_item_double_clicked(self, item):
         """Handle double-click on backup item"""
         self._restore_backup()
@@ -287,10 +381,13 @@ class RestoreDialog(QDialog):
             self.github_sync,
             filename,
             self.repository,
-            self.encryption_manager
+            self.encryption_manager,
+            prefetched=self._prefetch
         )
+        self._prefetch = None
 
         self.worker.progress.connect(self._on_progress)
+        self.worker.entries_restored.connect(self._on_entries_restored)
         self.worker.finished.connect(self._on_restore_finished)
         self.worker.start()
 
@@ -298,6 +395,12 @@ class RestoreDialog(QDialog):
         """Update progress message"""
         self.info_label.setText(message)
 
+    def _on_entries_restored(self, restored: int, total: int):
+        """Update the progress bar and message during the entry restore phase"""
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(restored)
+        self.info_label.setText(f"Restoring entries {restored}/{total}...")
+
     def _on_restore_finished(self, success: bool, message: str):
         """Handle restore completion"""
         self.progress_bar.setVisible(False)
@@ -10,7 +10,35 @@ from qfluentwidgets import (
 )
 from loguru import logger
 import os
-import yaml
+
+
+# Config locations, resolved once at import
+_CONFIG_DIR = os.path.join(os.environ.get('APPDATA', '.'), 'ClipboardHistory')
+_FIRST_RUN_FILE = os.path.join(_CONFIG_DIR, '.first_run_complete')
+
+# Files whose presence means setup has already happened
+_FIRST_RUN_MARKERS = frozenset({'.first_run_complete', 'github_settings.yaml'})
+
+# Theme stylesheets, built once at import rather than per dialog
+_DARK_QSS = """
+    QDialog {
+        background-color: #202020;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+"""
+
+_LIGHT_QSS = """
+    QDialog {
+        background-color: #f3f3f3;
+        color: #000000;
+    }
+    QLabel {
+        color: #000000;
+    }
+"""
 
 
 class WelcomeDialog(QDialog):
@@ -38,26 +66,7 @@ class WelcomeDialog(QDialog):
 
     def _apply_theme_style(self):
         """Apply theme-aware styling"""
-        if isDarkTheme():
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #202020;
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #f3f3f3;
-                    color: #000000;
-                }
-                QLabel {
-                    color: #000000;
-                }
-            """)
+        self.setStyleSheet(_DARK_QSS if isDarkTheme() else _LIGHT_QSS)
 
     def _setup_ui(self):
         """Setup the dialog UI"""
@@ -159,15 +168,10 @@ class WelcomeDialog(QDialog):
     def _on_skip(self):
         """Handle skip button click"""
         # Create minimal configuration for local-only mode
-        config_dir = os.path.join(
-            os.environ.get('APPDATA', '.'),
-            'ClipboardHistory'
-        )
-        os.makedirs(config_dir, exist_ok=True)
+        os.makedirs(_CONFIG_DIR, exist_ok=True)
 
         # Mark first run as complete
-        first_run_file = os.path.join(config_dir, '.first_run_complete')
-        with open(first_run_file, 'w') as f:
+        with open(_FIRST_RUN_FILE, 'w') as f:
             f.write('local_only')
 
         logger.info("User chose local storage only mode")
@@ -186,31 +190,21 @@ def check_first_run() -> bool:
     Returns:
         True if first run, False otherwise
     """
-    config_dir = os.path.join(
-        os.environ.get('APPDATA', '.'),
-        'ClipboardHistory'
-    )
-
-    # Check for first run marker file
-    first_run_file = os.path.join(config_dir, '.first_run_complete')
-
-    # Also check if GitHub settings exist
-    github_settings_file = os.path.join(config_dir, 'github_settings.yaml')
+    # It's first run if neither the first run marker nor GitHub settings exist.
+    # One directory listing answers both. A missing or unreadable directory
+    # means first run, as it did when each marker was checked with os.path.exists.
+    try:
+        with os.scandir(_CONFIG_DIR) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        return True
 
-    # It's first run if neither file exists
-    is_first_run = not os.path.exists(first_run_file) and not os.path.exists(github_settings_file)
-
-    return is_first_run
+    return not (_FIRST_RUN_MARKERS & names)
 
 
 def mark_first_run_complete():
     """Mark that first run setup has been completed"""
-    config_dir = os.path.join(
-        os.environ.get('APPDATA', '.'),
-        'ClipboardHistory'
-    )
-    os.makedirs(config_dir, exist_ok=True)
-
-    first_run_file = os.path.join(config_dir, '.first_run_complete')
-    with open(first_run_file, 'w') as f:
+    os.makedirs(_CONFIG_DIR, exist_ok=True)
+
+    with open(_FIRST_RUN_FILE, 'w') as f:
         f.write('completed')
\ No newline at end of file
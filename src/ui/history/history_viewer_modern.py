@@ -1,28 +1,431 @@
 """Modern history viewer with Windows 11 Fluent Design using PyQt6-Fluent-Widgets"""
 
 import sys
-import pyperclip
 from typing import Optional, List
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
-    QWidget, QListWidgetItem, QLabel, QSplitter
+    QWidget, QListView, QTextEdit, QLabel, QSplitter, QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize, QTimer
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import (
+    Qt, QRect, QSize, QTimer, QThread, QAbstractListModel, QModelIndex, QSortFilterProxyModel, pyqtSignal
+)
+from PyQt6.QtGui import QIcon, QFont, QColor, QFontMetrics
 
 # Import Fluent Design components
 from qfluentwidgets import (
-    ListWidget, TextEdit, PushButton, LineEdit,
+    ListView, ListItemDelegate, TextEdit, PushButton, LineEdit,
     ComboBox, ToolButton, InfoBar, InfoBarPosition, Theme,
     setTheme, isDarkTheme, FluentIcon as FIF, SearchLineEdit,
-    CardWidget, BodyLabel, SubtitleLabel, TitleLabel, CaptionLabel,
+    CardWidget, BodyLabel, StrongBodyLabel, SubtitleLabel, TitleLabel, CaptionLabel,
     TransparentToolButton, PrimaryPushButton, ToggleButton,
     MessageBox, Dialog, StateToolTip, setThemeColor,
-    FluentStyleSheet, qconfig, RoundMenu, Action
+    FluentStyleSheet, qconfig, RoundMenu, Action, getFont
 )
 from loguru import logger
 
+# Category icon mapping (using text icons for simplicity)
+CATEGORY_ICONS = {
+    "text": "📝",
+    "url": "🌐",
+    "file_path": "📁",
+    "email": "✉️"
+}
+
+# Category names
+CATEGORY_NAMES = {
+    "text": "Text",
+    "url": "Link",
+    "file_path": "File",
+    "email": "Email"
+}
+
+# Height of each history row
+HISTORY_ROW_HEIGHT = 75
+
+# Horizontal / vertical padding inside each history row
+HISTORY_ROW_PADDING = (16, 6)
+
+# Transparent background for the window's central widget; applied once
+_CENTRAL_QSS = """
+    #centralWidget {
+        background-color: transparent;
+    }
+"""
+
+# Entries loaded up front, and again each time the list is scrolled to its end
+HISTORY_PAGE_SIZE = 200
+
+# Category filter choices mapped to internal category names
+CATEGORY_FILTERS = {
+    "Text": "text",
+    "URL": "url",
+    "File Path": "file_path",
+    "Email": "email"
+}
+
+# Quiet period after the last keystroke before the search filter runs
+SEARCH_DEBOUNCE_MS = 150
+
+# Characters shown in the preview pane; copying still uses the full content.
+# Laying out a multi-megabyte payload would stall the GUI thread.
+MAX_PREVIEW_CHARS = 64 * 1024
+
+
+class EntryLoadWorker(QThread):
+    """Worker thread for loading history entries"""
+
+    finished = pyqtSignal(list, int, str)  # entries, total entry count, error message
+
+    def __init__(self, clipboard_history=None, repository=None, limit: int = HISTORY_PAGE_SIZE, offset: int = 0):
+        super().__init__()
+        self.clipboard_history = clipboard_history
+        self.repository = repository
+        self.limit = limit
+        self.offset = offset
+
+    def run(self):
+        """Load entries in background"""
+        try:
+            if self.repository:
+                # Load from database
+                entries = self.repository.get_entries(limit=self.limit, offset=self.offset)
+                # Use actual DB count to match _check_for_updates
+                total = self.repository.get_entry_count()
+            elif self.clipboard_history:
+                # Load from memory
+                entries = self.clipboard_history.get_entries(limit=self.limit, offset=self.offset)
+                total = self.clipboard_history.size
+            else:
+                entries = []
+                total = 0
+
+            self.finished.emit(entries, total, "")
+
+        except Exception as e:
+            logger.error(f"Failed to load entries: {e}")
+            self.finished.emit([], 0, str(e))
+
+
+class HistoryFileWorker(QThread):
+    """Worker thread for exporting or importing the history as a JSON file"""
+
+    finished = pyqtSignal(bool, str)  # success, error message
+
+    def __init__(self, clipboard_history, filename: str, export: bool):
+        super().__init__()
+        self.clipboard_history = clipboard_history
+        self.filename = filename
+        self.export = export
+
+    def run(self):
+        """Write or read the file in background"""
+        try:
+            if self.export:
+                with open(self.filename, 'w', encoding='utf-8') as f:
+                    self.clipboard_history.to_json_file(f)
+            else:
+                with open(self.filename, 'r', encoding='utf-8') as f:
+                    self.clipboard_history.from_json_file(f)
+
+            self.finished.emit(True, "")
+
+        except Exception as e:
+            logger.error(f"{'Export' if self.export else 'Import'} failed: {e}")
+            self.finished.emit(False, str(e))
+
+
+class HistoryClearWorker(QThread):
+    """Worker thread for clearing the stored history"""
+
+    finished = pyqtSignal(bool, str)  # success, error message
+
+    def __init__(self, clipboard_history=None, repository=None):
+        super().__init__()
+        self.clipboard_history = clipboard_history
+        self.repository = repository
+
+    def run(self):
+        """Clear database and memory in background"""
+        try:
+            # Clear from database if available
+            if self.repository:
+                success = self.repository.clear_all()
+                if not success:
+                    logger.warning("Failed to clear database")
+
+            # Clear from memory
+            if self.clipboard_history:
+                self.clipboard_history.clear()
+
+            self.finished.emit(True, "")
+
+        except Exception as e:
+            logger.error(f"Error during clear operation: {e}")
+            self.finished.emit(False, str(e))
+
+
+class HistoryModel(QAbstractListModel):
+    """List model over clipboard entries; row text is built only when Qt asks for it"""
+
+    # Emitted with the number of loaded rows when the view scrolls past them
+    more_requested = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._total = 0  # entries at the source, loaded or not
+        self._fetching = False
+        # Per-row caches, filled on first use and dropped on reset
+        self._display_texts = []
+        self._search_keys = []
+
+    def set_entries(self, entries: List, total: int = 0) -> bool:
+        """
+        Replace the entries shown by attached views
+
+        When the new list is the current one with entries added on top (and
+        the oldest possibly pushed off the end), only those rows are inserted
+        and removed, so views keep their selection and rows keep their caches.
+
+        Args:
+            entries: Clipboard entries, newest first
+            total: Number of entries at the source; more are fetched on scroll
+
+        Returns:
+            True if the model was reset (views lose their selection)
+        """
+        self._total = total
+        self._fetching = False
+        added = self._count_prepended(entries)
+        if added is None:
+            self.beginResetModel()
+            self._entries = entries
+            self._display_texts = [None] * len(entries)
+            self._search_keys = [None] * len(entries)
+            self.endResetModel()
+            return True
+
+        kept = len(entries) - added
+        if kept < len(self._entries):
+            self.beginRemoveRows(QModelIndex(), kept, len(self._entries) - 1)
+            self._entries = self._entries[:kept]
+            del self._display_texts[kept:]
+            del self._search_keys[kept:]
+            self.endRemoveRows()
+
+        if added:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self._display_texts[:0] = [None] * added
+            self._search_keys[:0] = [None] * added
+            self._entries = entries
+            self.endInsertRows()
+        else:
+            self._entries = entries
+        return False
+
+    def append_entries(self, entries: List, total: int):
+        """
+        Add a fetched page of older entries at the end
+
+        Args:
+            entries: Entries following the loaded ones, newest first
+            total: Number of entries at the source
+        """
+        self._fetching = False
+        self._total = total
+
+        # New entries on top shift later pages down; skip rows already loaded
+        loaded = {entry.content_hash for entry in self._entries}
+        entries = [entry for entry in entries if entry.content_hash not in loaded]
+        if not entries:
+            # Nothing further to show; stop asking until the next reload
+            self._total = len(self._entries)
+            return
+
+        start = len(self._entries)
+        self.beginInsertRows(QModelIndex(), start, start + len(entries) - 1)
+        # Extended in place: the list is shared with the viewer
+        self._entries.extend(entries)
+        self._display_texts.extend([None] * len(entries))
+        self._search_keys.extend([None] * len(entries))
+        self.endInsertRows()
+
+    def cancel_fetch(self):
+        """Allow fetchMore again after a page request was dropped"""
+        self._fetching = False
+
+    def total(self) -> int:
+        """Get the number of entries at the source"""
+        return max(self._total, len(self._entries))
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._fetching and len(self._entries) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if self.canFetchMore(parent):
+            # The viewer loads the page off the GUI thread and calls append_entries()
+            self._fetching = True
+            self.more_requested.emit(len(self._entries))
+
+    def _count_prepended(self, entries: List) -> Optional[int]:
+        """
+        Count entries added on top of the current list
+
+        Args:
+            entries: New entries, newest first
+
+        Returns:
+            Number of new leading entries, or None if the lists differ otherwise
+        """
+        if not self._entries or not entries:
+            return None
+
+        # A re-copied entry keeps its hash but gets a new timestamp
+        first = (self._entries[0].content_hash, self._entries[0].timestamp)
+        for added, entry in enumerate(entries):
+            if (entry.content_hash, entry.timestamp) == first:
+                break
+        else:
+            return None
+
+        kept = len(entries) - added
+        if kept > len(self._entries):
+            return None
+        for old, new in zip(self._entries, entries[added:]):
+            if old.content_hash != new.content_hash or old.timestamp != new.timestamp:
+                return None
+        return added
+
+    def entry(self, row: int):
+        """Get the entry at a source row"""
+        return self._entries[row]
+
+    def search_key(self, row: int) -> str:
+        """Get the lowercased content of a source row for searching"""
+        key = self._search_keys[row]
+        if key is None:
+            key = self._search_keys[row] = self._entries[row].content.lower()
+        return key
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Qt asks again on every repaint; format each row once
+            text = self._display_texts[row]
+            if text is None:
+                text = self._display_texts[row] = self._display_text(self._entries[row])
+            return text
+        return None
+
+    @staticmethod
+    def _display_text(entry) -> str:
+        """Format an entry for the history list"""
+        # Create display text
+        preview = entry.content[:80].replace('\n', ' ')
+        if len(entry.content) > 80:
+            preview += "..."
+
+        # Format timestamp
+        time_str = entry.timestamp.strftime("%H:%M · %b %d")
+
+        icon = CATEGORY_ICONS.get(entry.category, "📋")
+        category_name = CATEGORY_NAMES.get(entry.category, "Other")
+
+        return f"{icon} {time_str}\n{preview}\n{category_name} · {len(entry.content)} chars"
+
+
+class HistoryFilterModel(QSortFilterProxyModel):
+    """Filters a HistoryModel by search text and category"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_lower = ""
+        self._category = None  # internal category name, None for all
+
+    def set_filter(self, search_text: str, category: Optional[str]):
+        """
+        Update the filter and re-filter once
+
+        Args:
+            search_text: Case-insensitive substring to match in entry content
+            category: Internal category name, or None for all categories
+        """
+        search_lower = search_text.lower()
+        if search_lower == self._search_lower and category == self._category:
+            return
+
+        self._search_lower = search_lower
+        self._category = category
+        self.invalidateFilter()
+
+    def is_filtered(self) -> bool:
+        """Whether any filter is active"""
+        return bool(self._search_lower) or self._category is not None
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        if self._category is not None and model.entry(source_row).category != self._category:
+            return False
+        # Content is lowercased once per row, not on every keystroke
+        return not self._search_lower or self._search_lower in model.search_key(source_row)
+
+
+class HistoryItemDelegate(ListItemDelegate):
+    """Paints history rows directly with QPainter instead of through the style sheet"""
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        # Fonts and metrics are built once, not per paint
+        self._header_font = getFont(13, QFont.Weight.DemiBold)
+        self._body_font = getFont(13)
+        self._caption_font = getFont(12)
+        self._body_metrics = QFontMetrics(self._body_font)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # The row text is drawn in paint(); leave only the Fluent background to the style
+        option.text = ""
+
+    def paint(self, painter, option, index):
+        # Fluent hover/selection background and indicator
+        super().paint(painter, option, index)
+
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if not text:
+            return
+        header, preview, caption = text.split('\n', 2)
+
+        pad_x, pad_y = HISTORY_ROW_PADDING
+        rect = option.rect.adjusted(pad_x, pad_y, -pad_x, -pad_y)
+        line_height = rect.height() // 3
+        flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        dark = isDarkTheme()
+
+        painter.save()
+        painter.setPen(Qt.GlobalColor.white if dark else Qt.GlobalColor.black)
+        painter.setFont(self._header_font)
+        painter.drawText(QRect(rect.x(), rect.y(), rect.width(), line_height), flags, header)
+
+        painter.setFont(self._body_font)
+        preview = self._body_metrics.elidedText(preview, Qt.TextElideMode.ElideRight, rect.width())
+        painter.drawText(QRect(rect.x(), rect.y() + line_height, rect.width(), line_height), flags, preview)
+
+        painter.setPen(QColor(255, 255, 255, 150) if dark else QColor(0, 0, 0, 150))
+        painter.setFont(self._caption_font)
+        painter.drawText(QRect(rect.x(), rect.y() + 2 * line_height, rect.width(), line_height), flags, caption)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        # Every row is the same height; skip the style's size calculation
+        return QSize(option.rect.width(), HISTORY_ROW_HEIGHT)
+
 
 class ModernHistoryViewer(QMainWindow):
     """Modern history viewer window with Windows 11 Fluent Design"""
@@ -43,6 +446,24 @@ class ModernHistoryViewer(QMainWindow):
         self.current_entries = []
         self.last_entry_count = 0
 
+        # GitHub settings dialog, created on first open and then reused
+        self._github_settings_dialog = None
+
+        # Background entry load in progress, and what to select once it lands
+        self._entry_loader: Optional[EntryLoadWorker] = None
+        # Older page being fetched on scroll, and the load it extends
+        self._page_loader: Optional[EntryLoadWorker] = None
+        self._entries_generation = 0
+        self._page_generation = 0
+        self._file_worker: Optional[HistoryFileWorker] = None
+        self._clear_worker: Optional[HistoryClearWorker] = None
+        self._file_tooltip = None
+
+        # Hash of the entry last put on the clipboard by this viewer
+        self._copied_hash = None
+        self._reload_pending = False
+        self._pending_selection = None
+
         # Set window properties
         self.setWindowTitle("Clipboard History")
         self.resize(1100, 750)
@@ -80,11 +501,7 @@ class ModernHistoryViewer(QMainWindow):
 
         # Apply card-like background
         central_widget.setObjectName("centralWidget")
-        central_widget.setStyleSheet("""
-            #centralWidget {
-                background-color: transparent;
-            }
-        """)
+        central_widget.setStyleSheet(_CENTRAL_QSS)
 
         # Main layout
         main_layout = QVBoxLayout(central_widget)
@@ -139,6 +556,12 @@ class ModernHistoryViewer(QMainWindow):
         self.search_input = SearchLineEdit()
         self.search_input.setPlaceholderText("Search clipboard history...")
         self.search_input.textChanged.connect(self._on_search)
+
+        # Coalesce rapid typing into a single filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_filter)
         self.search_input.setFixedHeight(36)
 
         # Category filter
@@ -179,16 +602,26 @@ class ModernHistoryViewer(QMainWindow):
 
         list_layout.addWidget(list_header)
 
-        # History list with Fluent style
-        self.history_list = ListWidget()
-        self.history_list.currentItemChanged.connect(self._on_selection_changed)
-        self.history_list.itemDoubleClicked.connect(self._copy_to_clipboard)
+        # History list with Fluent style; rows are laid out a batch at a time
+        # and their text is only formatted once they scroll into view
+        self.history_model = HistoryModel(self)
+        self.history_model.more_requested.connect(self._fetch_more_entries)
+        self.history_filter = HistoryFilterModel(self)
+        self.history_filter.setSourceModel(self.history_model)
+        self.history_list = ListView()
+        self.history_list.setModel(self.history_filter)
+        self.history_list.setItemDelegate(HistoryItemDelegate(self.history_list))
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.history_list.setBatchSize(50)
+        self.history_list.selectionModel().currentChanged.connect(self._on_selection_changed)
+        self.history_list.doubleClicked.connect(self._copy_to_clipboard)
         list_layout.addWidget(self.history_list)
 
         splitter.addWidget(list_card)
 
         # Preview section
-        preview_card = CardWidget()
+        self.preview_card = preview_card = CardWidget()
         preview_layout = QVBoxLayout(preview_card)
         preview_layout.setContentsMargins(0, 0, 0, 0)
         preview_layout.setSpacing(0)
@@ -225,12 +658,14 @@ class ModernHistoryViewer(QMainWindow):
         metadata_layout = QVBoxLayout(metadata_widget)
         metadata_layout.setContentsMargins(16, 12, 16, 12)
 
-        metadata_title = BodyLabel("Details")
-        metadata_title.setStyleSheet("font-weight: bold;")
+        # Bold through the label's font rather than a per-widget style sheet
+        metadata_title = StrongBodyLabel("Details")
         metadata_layout.addWidget(metadata_title)
 
         self.metadata_label = CaptionLabel()
         self.metadata_label.setWordWrap(True)
+        # Skip the rich-text sniffing QLabel does on every setText
+        self.metadata_label.setTextFormat(Qt.TextFormat.PlainText)
         metadata_layout.addWidget(self.metadata_label)
         metadata_layout.addStretch()
 
@@ -243,60 +678,163 @@ class ModernHistoryViewer(QMainWindow):
 
     def _load_entries(self):
         """Load clipboard entries"""
-        try:
-            self.history_list.clear()
-
-            if self.repository:
-                # Load from database
-                self.current_entries = self.repository.get_entries(limit=500)
-            elif self.clipboard_history:
-                # Load from memory
-                self.current_entries = self.clipboard_history.get_entries(limit=500)
-            else:
-                self.current_entries = []
+        if self._entry_loader is not None:
+            # Reload again once the running load lands
+            self._reload_pending = True
+            return
 
-            # Add to list widget
-            for entry in self.current_entries:
-                self._add_entry_to_list(entry)
+        self.count_label.setText("Loading...")
 
-            # Update count
-            self.count_label.setText(f"{len(self.current_entries)} items")
+        # Query the database off the GUI thread, keeping pages already scrolled into
+        limit = max(HISTORY_PAGE_SIZE, len(self.current_entries))
+        self._entry_loader = EntryLoadWorker(self.clipboard_history, self.repository, limit=limit)
+        self._entry_loader.finished.connect(self._on_entries_loaded)
+        self._entry_loader.start()
 
-            # Update last entry count (use actual DB count to match _check_for_updates)
-            if self.repository:
-                self.last_entry_count = self.repository.get_entry_count()
-            else:
-                self.last_entry_count = len(self.current_entries)
-
-            # Show success notification only for manual refresh or initial load
-            if not hasattr(self, '_initial_load_done'):
-                InfoBar.success(
-                    title="Loaded",
-                    content=f"Loaded {len(self.current_entries)} entries",
-                    orient=Qt.Orientation.Horizontal,
-                    isClosable=True,
-                    position=InfoBarPosition.TOP,
-                    duration=2000,
-                    parent=self
-                )
-                self._initial_load_done = True
+    def _on_entries_loaded(self, entries: list, total: int, error: str):
+        """
+        Show entries loaded by the background worker
 
-            logger.info(f"Loaded {len(self.current_entries)} entries")
+        Args:
+            entries: Loaded entries, newest first
+            total: Total number of entries at the source
+            error: Error message if loading raised
+        """
+        # finished is emitted from inside run(); let the thread exit before
+        # dropping the last reference, or Qt aborts on a running QThread
+        self._entry_loader.wait()
+        self._entry_loader = None
+        if self._reload_pending:
+            # Something changed while loading; this result is already stale
+            self._reload_pending = False
+            self._load_entries()
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to load entries: {e}")
+        if error:
+            self._update_count_label()
             InfoBar.error(
                 title="Error",
-                content=f"Failed to load entries: {str(e)}",
+                content=f"Failed to load entries: {error}",
                 orient=Qt.Orientation.Horizontal,
                 isClosable=True,
                 position=InfoBarPosition.TOP,
                 duration=3000,
                 parent=self
             )
+            return
+
+        previous_count = self.last_entry_count
+        self.current_entries = entries
+        self._entries_generation += 1
+
+        # Hand the list to the model; the view formats rows on demand.
+        # A reset drops the selection without signalling, so clear the preview
+        if self.history_model.set_entries(self.current_entries, total):
+            self.preview_text.clear()
+            self.metadata_label.clear()
+
+        # Update count
+        self.last_entry_count = total
+        self._update_count_label()
+
+        # Show success notification only for manual refresh or initial load
+        if not hasattr(self, '_initial_load_done'):
+            InfoBar.success(
+                title="Loaded",
+                content=f"Loaded {len(self.current_entries)} entries",
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=2000,
+                parent=self
+            )
+            self._initial_load_done = True
+
+        elif self._pending_selection is not None:
+            # Reload triggered by _check_for_updates
+            self._restore_selection(self._pending_selection)
+
+            # Show notification only for new entries (not deletions)
+            if total > previous_count:
+                InfoBar.success(
+                    title="New Entry",
+                    content="Clipboard history updated",
+                    orient=Qt.Orientation.Horizontal,
+                    isClosable=True,
+                    position=InfoBarPosition.BOTTOM_RIGHT,
+                    duration=1500,
+                    parent=self
+                )
+
+        self._pending_selection = None
+        logger.info(f"Loaded {len(self.current_entries)} entries")
+
+    def _fetch_more_entries(self, offset: int):
+        """
+        Load the next page of older entries
+
+        Args:
+            offset: Number of entries already loaded
+        """
+        if self._page_loader is not None:
+            # A page from before the last reload is still running
+            self.history_model.cancel_fetch()
+            return
+
+        self._page_generation = self._entries_generation
+        self._page_loader = EntryLoadWorker(self.clipboard_history, self.repository, offset=offset)
+        self._page_loader.finished.connect(self._on_page_loaded)
+        self._page_loader.start()
+
+    def _on_page_loaded(self, entries: list, total: int, error: str):
+        """
+        Append a page loaded by the background worker
+
+        Args:
+            entries: Loaded entries, newest first
+            total: Total number of entries at the source
+            error: Error message if loading raised
+        """
+        # Emitted from run(); the thread must exit before it is released
+        self._page_loader.wait()
+        self._page_loader = None
+        if self._page_generation != self._entries_generation:
+            # The list was reloaded or cleared meanwhile; the offset no longer applies
+            return
+        if error:
+            self.history_model.cancel_fetch()
+            return
+
+        self.history_model.append_entries(entries, total)
+        self._update_count_label()
+
+    def _restore_selection(self, content: str):
+        """
+        Select the entry with the given content, or the newest entry
+
+        Args:
+            content: Content of the previously selected entry ('' if none)
+        """
+        # Try to restore selection based on content
+        if content:
+            for i, entry in enumerate(self.current_entries):
+                if entry.content == content:
+                    index = self.history_filter.mapFromSource(self.history_model.index(i))
+                    if index.isValid():
+                        self.history_list.setCurrentIndex(index)
+                        return
+                    break
+
+        # If not found, select the first (newest) visible item
+        if self.history_filter.rowCount() > 0:
+            self.history_list.setCurrentIndex(self.history_filter.index(0, 0))
 
     def _check_for_updates(self):
         """Check for new clipboard entries and refresh if needed"""
+        if self._entry_loader is not None or self._clear_worker is not None:
+            # last_entry_count is refreshed when the running load or clear lands
+            return
+
         try:
             # Get current entry count from the actual source
             if self.repository:
@@ -309,93 +847,53 @@ class ModernHistoryViewer(QMainWindow):
             # If count changed, refresh the list
             if current_count != self.last_entry_count:
                 # Remember current selection
-                current_row = self.history_list.currentRow()
-                current_item_content = None
+                current_index = self.history_list.currentIndex()
+                current_item_content = ''
 
-                if current_row >= 0 and current_row < len(self.current_entries):
-                    current_item_content = self.current_entries[current_row].content
+                if current_index.isValid():
+                    current_item_content = self._entry_at(current_index).content
 
-                # Reload entries - this will update self.last_entry_count
+                # Reload entries; selection is restored once they arrive
+                self._pending_selection = current_item_content
                 self._load_entries()
 
-                # Try to restore selection based on content
-                if current_item_content:
-                    for i, entry in enumerate(self.current_entries):
-                        if entry.content == current_item_content:
-                            self.history_list.setCurrentRow(i)
-                            break
-                    else:
-                        # If not found, select the first item
-                        if self.history_list.count() > 0:
-                            self.history_list.setCurrentRow(0)
-                elif self.history_list.count() > 0:
-                    # Select the first (newest) item
-                    self.history_list.setCurrentRow(0)
-
-                # Show notification only for new entries (not deletions)
-                if current_count > self.last_entry_count:
-                    InfoBar.success(
-                        title="New Entry",
-                        content="Clipboard history updated",
-                        orient=Qt.Orientation.Horizontal,
-                        isClosable=True,
-                        position=InfoBarPosition.BOTTOM_RIGHT,
-                        duration=1500,
-                        parent=self
-                    )
-
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
 
-    def _add_entry_to_list(self, entry):
-        """Add entry to list widget with modern styling"""
-        # Create display text
-        preview = entry.content[:80].replace('\n', ' ')
-        if len(entry.content) > 80:
-            preview += "..."
+    def _entry_at(self, index: QModelIndex):
+        """
+        Get the entry shown at a view index
 
-        # Format timestamp
-        time_str = entry.timestamp.strftime("%H:%M · %b %d")
+        Args:
+            index: Valid index into the filtered list
 
-        # Category icon mapping (using text icons for simplicity)
-        category_icons = {
-            "text": "📝",
-            "url": "🌐",
-            "file_path": "📁",
-            "email": "✉️"
-        }
-        icon = category_icons.get(entry.category, "📋")
-
-        # Category names
-        category_names = {
-            "text": "Text",
-            "url": "Link",
-            "file_path": "File",
-            "email": "Email"
-        }
-        category_name = category_names.get(entry.category, "Other")
-
-        # Create list item with rich formatting
-        item_text = f"{icon} {time_str}\n{preview}\n{category_name} · {len(entry.content)} chars"
-        item = QListWidgetItem(item_text)
-        item.setData(Qt.ItemDataRole.UserRole, entry)
-
-        # Set item height
-        item.setSizeHint(QSize(0, 75))
-
-        self.history_list.addItem(item)
+        Returns:
+            Clipboard entry for that row
+        """
+        # Looked up by row; entries aren't boxed into QVariants for the view
+        return self.history_model.entry(self.history_filter.mapToSource(index).row())
 
     def _on_selection_changed(self, current, previous):
         """Handle selection change"""
-        if not current:
+        if not current.isValid():
             self.preview_text.clear()
             self.metadata_label.clear()
             return
 
-        entry = current.data(Qt.ItemDataRole.UserRole)
+        entry = self._entry_at(current)
         if entry:
-            # Update preview
-            self.preview_text.setPlainText(entry.content)
+            # Preview and metadata change together; repaint the card once
+            self.preview_card.setUpdatesEnabled(False)
+
+            # Update preview, truncated so huge payloads don't stall the layout
+            content = entry.content
+            if len(content) > MAX_PREVIEW_CHARS:
+                # Long unbroken lines are costly to wrap; show them unwrapped
+                self.preview_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+                self.preview_text.setPlainText(content[:MAX_PREVIEW_CHARS] + "\n…[truncated]")
+            else:
+                self.preview_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+                self.preview_text.setPlainText(content)
 
             # Update metadata with modern formatting
             metadata_lines = [
@@ -406,64 +904,44 @@ class ModernHistoryViewer(QMainWindow):
             ]
             self.metadata_label.setText(" · ".join(metadata_lines))
 
+            self.preview_card.setUpdatesEnabled(True)
+
     def _on_search(self, text):
         """Handle search input"""
-        search_text = text.lower()
-        visible_count = 0
-
-        for i in range(self.history_list.count()):
-            item = self.history_list.item(i)
-            entry = item.data(Qt.ItemDataRole.UserRole)
-
-            if entry:
-                # Check if entry matches search
-                if search_text in entry.content.lower():
-                    item.setHidden(False)
-                    visible_count += 1
-                else:
-                    item.setHidden(True)
-
-        # Update count label
-        self.count_label.setText(f"{visible_count} of {len(self.current_entries)} items")
+        # Restart the debounce; the filter runs once typing pauses
+        self._search_timer.start()
 
     def _on_filter_change(self, category):
         """Handle category filter change"""
-        visible_count = 0
-
-        for i in range(self.history_list.count()):
-            item = self.history_list.item(i)
-            entry = item.data(Qt.ItemDataRole.UserRole)
-
-            if entry:
-                if category == "All":
-                    item.setHidden(False)
-                    visible_count += 1
-                else:
-                    # Convert display category to internal format
-                    category_map = {
-                        "Text": "text",
-                        "URL": "url",
-                        "File Path": "file_path",
-                        "Email": "email"
-                    }
-                    internal_category = category_map.get(category, "text")
-
-                    if entry.category == internal_category:
-                        item.setHidden(False)
-                        visible_count += 1
-                    else:
-                        item.setHidden(True)
-
-        # Update count label
-        self.count_label.setText(f"{visible_count} of {len(self.current_entries)} items")
+        self._search_timer.stop()
+        self._apply_filter()
+
+    def _apply_filter(self):
+        """Filter the history list by the current search text and category"""
+        category = CATEGORY_FILTERS.get(self.category_combo.currentText())
+        self.history_filter.set_filter(self.search_input.text(), category)
+        self._update_count_label()
+
+    def _update_count_label(self):
+        """Show how many entries are listed"""
+        total = self.history_model.total()
+        if self.history_filter.is_filtered():
+            self.count_label.setText(f"{self.history_filter.rowCount()} of {total} items")
+        else:
+            self.count_label.setText(f"{total} items")
 
     def _copy_to_clipboard(self):
         """Copy selected entry to clipboard"""
-        current_item = self.history_list.currentItem()
-        if current_item:
-            entry = current_item.data(Qt.ItemDataRole.UserRole)
+        current_index = self.history_list.currentIndex()
+        if current_index.isValid():
+            entry = self._entry_at(current_index)
             if entry:
-                pyperclip.copy(entry.content)
+                # In-process; pyperclip shells out to xclip/xsel on Linux.
+                # Repeat copies of the entry we still hold are no-ops
+                clipboard = QApplication.clipboard()
+                if entry.content_hash != self._copied_hash or not clipboard.ownsClipboard():
+                    clipboard.setText(entry.content)
+                    self._copied_hash = entry.content_hash
 
                 # Show success notification
                 InfoBar.success(
@@ -480,9 +958,9 @@ class ModernHistoryViewer(QMainWindow):
 
     def _toggle_favorite(self):
         """Toggle favorite status of selected entry"""
-        current_item = self.history_list.currentItem()
-        if current_item and self.repository:
-            entry = current_item.data(Qt.ItemDataRole.UserRole)
+        current_index = self.history_list.currentIndex()
+        if current_index.isValid() and self.repository:
+            entry = self._entry_at(current_index)
             if entry:
                 success = self.repository.toggle_favorite(entry.content_hash)
                 if success:
@@ -514,50 +992,16 @@ class ModernHistoryViewer(QMainWindow):
             w.yesButton.setText("Clear")
             w.cancelButton.setText("Cancel")
 
-            if w.exec():
-                try:
-                    # Clear from database if available
-                    if self.repository:
-                        success = self.repository.clear_all()
-                        if not success:
-                            logger.warning("Failed to clear database")
-
-                    # Clear from memory - check if attribute exists
-                    if hasattr(self, 'clipboard_history') and self.clipboard_history:
-                        self.clipboard_history.clear()
-
-                    # Clear UI
-                    self.history_list.clear()
-                    self.preview_text.clear()
-                    self.metadata_label.clear()
-                    self.current_entries = []
-                    self.last_entry_count = 0
-                    self.count_label.setText("0 items")
-
-                    # Show notification
-                    InfoBar.success(
-                        title="Cleared",
-                        content="History has been cleared",
-                        orient=Qt.Orientation.Horizontal,
-                        isClosable=True,
-                        position=InfoBarPosition.TOP,
-                        duration=2000,
-                        parent=self
-                    )
+            if w.exec() and self._clear_worker is None:
+                # The table delete runs off the GUI thread; hold off other
+                # reloads and clears until it lands
+                self.clear_btn.setEnabled(False)
+                self.refresh_btn.setEnabled(False)
+                self.count_label.setText("Clearing...")
 
-                    logger.info("Clipboard history cleared successfully")
-
-                except Exception as e:
-                    logger.error(f"Error during clear operation: {e}")
-                    InfoBar.error(
-                        title="Clear Failed",
-                        content=f"Failed to clear history: {str(e)}",
-                        orient=Qt.Orientation.Horizontal,
-                        isClosable=True,
-                        position=InfoBarPosition.TOP,
-                        duration=5000,
-                        parent=self
-                    )
+                self._clear_worker = HistoryClearWorker(self.clipboard_history, self.repository)
+                self._clear_worker.finished.connect(self._on_history_cleared)
+                self._clear_worker.start()
 
         except Exception as e:
             logger.error(f"Error showing clear dialog: {e}")
@@ -571,10 +1015,60 @@ class ModernHistoryViewer(QMainWindow):
                 parent=self
             )
 
+    def _on_history_cleared(self, success: bool, error: str):
+        """
+        Handle clear completion
+
+        Args:
+            success: Whether the history was cleared
+            error: Error message if clearing raised
+        """
+        # Emitted from run(); the thread must exit before it is released
+        self._clear_worker.wait()
+        self._clear_worker = None
+        self.clear_btn.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
+
+        if not success:
+            self._update_count_label()
+            InfoBar.error(
+                title="Clear Failed",
+                content=f"Failed to clear history: {error}",
+                orient=Qt.Orientation.Horizontal,
+                isClosable=True,
+                position=InfoBarPosition.TOP,
+                duration=5000,
+                parent=self
+            )
+            return
+
+        # Clear UI
+        self.current_entries = []
+        self._entries_generation += 1
+        self.history_model.set_entries(self.current_entries)
+        self.preview_text.clear()
+        self.metadata_label.clear()
+        self.last_entry_count = 0
+        self._update_count_label()
+        if self._entry_loader is not None:
+            # Don't let a load started before the clear repopulate the list
+            self._reload_pending = True
+
+        # Show notification
+        InfoBar.success(
+            title="Cleared",
+            content="History has been cleared",
+            orient=Qt.Orientation.Horizontal,
+            isClosable=True,
+            position=InfoBarPosition.TOP,
+            duration=2000,
+            parent=self
+        )
+
+        logger.info("Clipboard history cleared successfully")
+
     def _export_history(self):
         """Export history to file"""
-        from PyQt6.QtWidgets import QFileDialog
-
         filename, _ = QFileDialog.getSaveFileName(
             self,
             "Export History",
@@ -583,32 +1077,10 @@ class ModernHistoryViewer(QMainWindow):
         )
 
         if filename and self.clipboard_history:
-            # Show progress tooltip
-            stateTooltip = StateToolTip("Exporting", "Please wait...", self)
-            stateTooltip.move(self.geometry().center())
-            stateTooltip.show()
-
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.clipboard_history.to_json())
-
-                stateTooltip.setContent("Export completed successfully")
-                stateTooltip.setState(True)
-
-                logger.info(f"History exported to {filename}")
-
-            except Exception as e:
-                stateTooltip.setContent(f"Export failed: {str(e)}")
-                stateTooltip.setState(False)
-                logger.error(f"Export failed: {e}")
-
-            finally:
-                stateTooltip.hide()
+            self._start_file_worker(filename, export=True)
 
     def _import_history(self):
         """Import history from file"""
-        from PyQt6.QtWidgets import QFileDialog
-
         filename, _ = QFileDialog.getOpenFileName(
             self,
             "Import History",
@@ -617,29 +1089,61 @@ class ModernHistoryViewer(QMainWindow):
         )
 
         if filename and self.clipboard_history:
-            # Show progress tooltip
-            stateTooltip = StateToolTip("Importing", "Please wait...", self)
-            stateTooltip.move(self.geometry().center())
-            stateTooltip.show()
+            self._start_file_worker(filename, export=False)
 
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    self.clipboard_history.from_json(f.read())
+    def _start_file_worker(self, filename: str, export: bool):
+        """
+        Export or import the history file off the GUI thread
 
-                self._load_entries()
+        Args:
+            filename: JSON file to write or read
+            export: True to export, False to import
+        """
+        # Show progress tooltip
+        self._file_tooltip = StateToolTip("Exporting" if export else "Importing", "Please wait...", self)
+        self._file_tooltip.move(self.geometry().center())
+        self._file_tooltip.show()
 
-                stateTooltip.setContent("Import completed successfully")
-                stateTooltip.setState(True)
+        # One file operation at a time
+        self.export_btn.setEnabled(False)
+        self.import_btn.setEnabled(False)
 
-                logger.info(f"History imported from {filename}")
+        self._file_worker = HistoryFileWorker(self.clipboard_history, filename, export)
+        self._file_worker.finished.connect(self._on_file_worker_finished)
+        self._file_worker.start()
 
-            except Exception as e:
-                stateTooltip.setContent(f"Import failed: {str(e)}")
+    def _on_file_worker_finished(self, success: bool, error: str):
+        """
+        Handle export/import completion
+
+        Args:
+            success: Whether the file operation succeeded
+            error: Error message if it failed
+        """
+        worker = self._file_worker
+        # Emitted from run(); the thread must exit before it is released
+        worker.wait()
+        self._file_worker = None
+        self.export_btn.setEnabled(True)
+        self.import_btn.setEnabled(True)
+
+        action = "Export" if worker.export else "Import"
+        stateTooltip = self._file_tooltip
+        try:
+            if success:
+                if not worker.export:
+                    self._load_entries()
+
+                stateTooltip.setContent(f"{action} completed successfully")
+                stateTooltip.setState(True)
+
+                logger.info(f"History {action.lower()}ed {'to' if worker.export else 'from'} {worker.filename}")
+            else:
+                stateTooltip.setContent(f"{action} failed: {error}")
                 stateTooltip.setState(False)
-                logger.error(f"Import failed: {e}")
 
-            finally:
-                stateTooltip.hide()
+        finally:
+            stateTooltip.hide()
 
     def _show_settings(self):
         """Show settings menu"""
@@ -690,23 +1194,28 @@ class ModernHistoryViewer(QMainWindow):
     def _show_github_settings(self):
         """Show GitHub settings dialog"""
         try:
-            from src.ui.dialogs import GitHubSettingsDialog
+            dialog = self._github_settings_dialog
+            if dialog is None:
+                from src.ui.dialogs import GitHubSettingsDialog
+
+                # Built once and reused; later opens only refresh the fields
+                dialog = GitHubSettingsDialog(self)
 
-            dialog = GitHubSettingsDialog(self)
+                # Connect signal to handle saved settings
+                dialog.settings_saved.connect(self._on_github_settings_saved)
 
-            # Connect signal to handle saved settings
-            dialog.settings_saved.connect(self._on_github_settings_saved)
+                # Add restore from GitHub button handler
+                dialog.restore_requested.connect(self._restore_from_github)
 
-            # Add restore from GitHub button handler
-            dialog.restore_requested.connect(self._restore_from_github)
+                self._github_settings_dialog = dialog
+            else:
+                dialog.refresh()
 
             dialog.exec()
 
         except ImportError as e:
             logger.error(f"Failed to import GitHubSettingsDialog: {e}")
             # Fallback to simple dialog
-            from qfluentwidgets import Dialog
-
             w = Dialog(
                 title="Settings",
                 content="GitHub sync settings can be edited in:\n%APPDATA%\\ClipboardHistory\\github_settings.yaml\n\nSettings UI temporarily unavailable.",
@@ -745,10 +1254,14 @@ class ModernHistoryViewer(QMainWindow):
                 # Update GitHub sync service with new settings
                 from src.services.sync.github_sync import GitHubSyncService
 
+                previous_sync = getattr(self.main_app, 'github_sync', None)
                 self.main_app.github_sync = GitHubSyncService(
                     token=settings.get('token'),
                     repository=settings.get('repository')
                 )
+                if previous_sync:
+                    # Release the replaced service's HTTP session and executor
+                    previous_sync.close()
                 logger.info("GitHub sync service reinitialized")
 
                 # Reinitialize auto sync service if GitHub sync is enabled
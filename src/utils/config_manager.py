@@ -1,11 +1,12 @@
 """Configuration management module"""
 
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
 
+from . import yaml_codec
+
 
 class ConfigManager:
     """Manages application configuration"""
@@ -35,7 +36,7 @@ class ConfigManager:
         try:
             if default_path.exists():
                 with open(default_path, 'r', encoding='utf-8') as f:
-                    self.config = yaml.safe_load(f) or {}
+                    self.config = yaml_codec.load(f) or {}
                 logger.info("Loaded default configuration")
             else:
                 logger.warning(f"Default config not found: {default_path}")
@@ -67,7 +68,8 @@ class ConfigManager:
                 'repository': '',
                 'token': '',
                 'sync_interval': 3600,
-                'auto_sync': False
+                'auto_sync': False,
+                'compress_payloads': False
             },
             'cleanup': {
                 'enabled': True,
@@ -93,7 +95,7 @@ class ConfigManager:
         try:
             if os.path.exists(self.config_path):
                 with open(self.config_path, 'r', encoding='utf-8') as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml_codec.load(f) or {}
 
                 # Merge with defaults
                 self._merge_config(self.config, user_config)
@@ -112,7 +114,7 @@ class ConfigManager:
 
             if github_config_path.exists():
                 with open(github_config_path, 'r', encoding='utf-8') as f:
-                    github_config = yaml.safe_load(f) or {}
+                    github_config = yaml_codec.load(f) or {}
 
                 if 'github' in github_config:
                     github_settings = github_config['github']
@@ -172,7 +174,7 @@ class ConfigManager:
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
 
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                yaml_codec.dump(self.config, f)
 
             logger.info(f"Configuration saved to {self.config_path}")
             return True
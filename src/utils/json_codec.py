@@ -0,0 +1,49 @@
+"""JSON encoding helpers backed by orjson when it is available"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
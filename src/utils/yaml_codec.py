@@ -0,0 +1,47 @@
+"""YAML helpers backed by the libyaml C bindings when they are available"""
+
+from typing import Any, IO
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+def load(stream: IO) -> Any:
+    """
+    Parse a YAML document (safe subset)
+
+    Args:
+        stream: Open file or string
+
+    Returns:
+        Parsed object (None for an empty document)
+    """
+    return yaml.load(stream, Loader=_Loader)
+
+
+def dump(data: Any, stream: IO) -> None:
+    """
+    Write data as block-style YAML (safe subset)
+
+    Args:
+        data: Object to serialize
+        stream: Open file to write to
+    """
+    yaml.dump(data, stream, Dumper=_Dumper, default_flow_style=False)
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize data as block-style YAML (safe subset)
+
+    Args:
+        data: Object to serialize
+
+    Returns:
+        YAML document as a string
+    """
+    return yaml.dump(data, Dumper=_Dumper, default_flow_style=False)